@@ -4,7 +4,7 @@ Provides endpoints for workflow control, lead management, and CRM integration
 """
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Depends, Header, Request
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Dict, List, Any, Optional
@@ -19,8 +19,11 @@ from collections import defaultdict, deque
 import shutil
 import gzip
 from automation_orchestrator.audit import get_audit_logger
+from automation_orchestrator.crm_connector import flush_audit
 from automation_orchestrator.deduplication import DeduplicationEngine
-from automation_orchestrator.rbac import RBACManager, Role, Permission, User
+from automation_orchestrator.rbac import (
+    RBACManager, Role, Permission, User, permission_check_scope
+)
 from automation_orchestrator.analytics import Analytics
 from automation_orchestrator.multi_tenancy import TenantManager, TenantContext
 from automation_orchestrator.monitoring import (
@@ -31,9 +34,16 @@ from automation_orchestrator.auth import (
     global_user_store, LoginRequest, LoginResponse, APIKeyCreateRequest,
     APIKeyResponse
 )
-from automation_orchestrator.redis_queue import get_queue
+from automation_orchestrator.redis_queue import get_queue, close_async_queue
 from automation_orchestrator.licensing import LicenseManager
 
+# Optional fast JSON rendering for large list responses
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 audit = get_audit_logger()
 
@@ -221,9 +231,14 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
             if not app.state.redis_queue or not app.state.redis_queue.ping():
                 raise RuntimeError("Redis is required but not available")
         yield
-        if app.state.redis_queue and app.state.redis_queue.client:
+        flush_audit()
+        try:
+            await close_async_queue()
+        except Exception:
+            pass
+        if app.state.redis_queue:
             try:
-                app.state.redis_queue.client.close()
+                app.state.redis_queue.close()
             except Exception:
                 pass
 
@@ -393,7 +408,8 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
                 return JSONResponse(status_code=429, content={"detail": "Rate limit exceeded"})
 
         try:
-            response = await call_next(request)
+            with permission_check_scope():
+                response = await call_next(request)
             status_code = response.status_code
         except Exception as e:
             app.state.metrics["requests_failed"] += 1
@@ -408,7 +424,8 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
             })
             raise
         finally:
-            duration_ms = (time.time() - start) * 1000.0
+            end = time.time()
+            duration_ms = (end - start) * 1000.0
             
             # Update legacy metrics
             app.state.metrics["requests_total"] += 1
@@ -422,7 +439,8 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
                 method=method,
                 status_code=status_code,
                 latency_ms=duration_ms,
-                error=error_msg
+                error=error_msg,
+                now=end
             )
             
             # Log request
@@ -759,7 +777,11 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
     @app.get("/api/license/status", tags=["License"])
     async def license_status():
         """Get current license status."""
-        return app.state.license_manager.get_status().to_dict()
+        # Status objects are cached, so their serialized form is reused too
+        return Response(
+            content=app.state.license_manager.get_status().json_bytes,
+            media_type="application/json"
+        )
 
     @app.get("/api/license/purchase", tags=["License"])
     async def license_purchase():
@@ -1577,6 +1599,13 @@ def create_app(config: Dict[str, Any], lead_ingest=None, crm_connector=None,
     @app.get("/api/users", tags=["RBAC"])
     async def list_users(active_only: bool = False):
         """List all users"""
+        # PERFORMANCE: Serialize user dicts straight to bytes with orjson,
+        # skipping FastAPI's jsonable_encoder pass over the whole list
+        if HAS_ORJSON:
+            return Response(
+                content=orjson.dumps(list(app.state.rbac.iter_users(active_only))),
+                media_type="application/json"
+            )
         return app.state.rbac.list_users(active_only)
     
     @app.get("/api/users/{user_id}", tags=["RBAC"])
@@ -4,16 +4,30 @@ Integration with HubSpot using REST API
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
+from urllib.parse import urlencode
 import requests
 import os
-from automation_orchestrator.crm_connector import CRMConnector
+from automation_orchestrator.crm_connector import (
+    CRMConnector, queue_audit_event, iter_json_items
+)
 from automation_orchestrator.audit import get_audit_logger
 from automation_orchestrator.security import SecretManager
 
 logger = logging.getLogger(__name__)
 audit = get_audit_logger()
 
+CONTACTS_URL = "/crm/v3/objects/contacts"
+_HUBSPOT_DEFAULT_PROPERTIES = [
+    'firstname', 'lastname', 'email', 'phone', 'company',
+    'hs_lead_status', 'lifecyclestage'
+]
+
+# PERFORMANCE: Property lists are static, so encode the query strings once
+# (HubSpot accepts the comma-joined properties=a,b,c form)
+_PROPERTIES_QS = urlencode({'properties': ','.join(_HUBSPOT_DEFAULT_PROPERTIES)})
+_LIST_QS = urlencode({'limit': 100, 'properties': ','.join(_HUBSPOT_DEFAULT_PROPERTIES)})
+
 
 class HubSpotConnector(CRMConnector):
     """HubSpot CRM connector implementation"""
@@ -97,7 +111,7 @@ class HubSpotConnector(CRMConnector):
             if existing_contact:
                 # Update existing contact
                 contact_id = existing_contact['id']
-                url = f"{self.base_url}/crm/v3/objects/contacts/{contact_id}"
+                url = f"{self.base_url}{CONTACTS_URL}/{contact_id}"
                 payload = {'properties': hs_properties}
                 
                 response = requests.patch(
@@ -111,7 +125,7 @@ class HubSpotConnector(CRMConnector):
                 self.logger.info(f"Updated HubSpot contact {contact_id}")
             else:
                 # Create new contact
-                url = f"{self.base_url}/crm/v3/objects/contacts"
+                url = f"{self.base_url}{CONTACTS_URL}"
                 payload = {'properties': hs_properties}
                 
                 response = requests.post(
@@ -125,7 +139,8 @@ class HubSpotConnector(CRMConnector):
                 lead['crm_id'] = contact_id
                 self.logger.info(f"Created HubSpot contact {contact_id}")
             
-            self.audit.log_event(
+            queue_audit_event(
+                self.audit,
                 event_type="crm_create",
                 lead_id=lead.get('id'),
                 details={"hubspot_id": contact_id}
@@ -135,7 +150,8 @@ class HubSpotConnector(CRMConnector):
         
         except Exception as e:
             self.logger.error(f"Error creating/updating HubSpot contact: {e}")
-            self.audit.log_event(
+            queue_audit_event(
+                self.audit,
                 event_type="error",
                 details={"error": str(e), "operation": "hubspot_create_update"}
             )
@@ -144,7 +160,7 @@ class HubSpotConnector(CRMConnector):
     def _find_contact_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Find contact by email address"""
         try:
-            url = f"{self.base_url}/crm/v3/objects/contacts"
+            url = f"{self.base_url}{CONTACTS_URL}"
             params = {
                 'limit': 1,
                 'after': 0,
@@ -187,17 +203,10 @@ class HubSpotConnector(CRMConnector):
             Contact data or None if not found
         """
         try:
-            url = f"{self.base_url}/crm/v3/objects/contacts/{lead_id}"
-            params = {
-                'properties': [
-                    'firstname', 'lastname', 'email', 'phone', 'company',
-                    'hs_lead_status', 'hs_lead_status', 'lifecyclestage'
-                ]
-            }
+            url = f"{self.base_url}{CONTACTS_URL}/{lead_id}?{_PROPERTIES_QS}"
             
             response = requests.get(
                 url,
-                params=params,
                 headers=self._get_headers(),
                 timeout=10
             )
@@ -220,19 +229,33 @@ class HubSpotConnector(CRMConnector):
             List of contacts
         """
         try:
-            url = f"{self.base_url}/crm/v3/objects/contacts"
-            
+            return list(self.iter_leads(filters))
+        
+        except Exception as e:
+            self.logger.error(f"Error listing HubSpot contacts: {e}")
+            return []
+    
+    def iter_leads(self, filters: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream contacts from HubSpot one record at a time
+        
+        Args:
+            filters: Optional filters (source, email, etc.)
+        
+        Yields:
+            Contact records
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        url = f"{self.base_url}{CONTACTS_URL}"
+        
+        # Add filters if provided
+        if filters and 'email' in filters:
             params = {
                 'limit': 100,
-                'properties': [
-                    'firstname', 'lastname', 'email', 'phone', 'company',
-                    'hs_lead_status', 'lifecyclestage'
-                ]
-            }
-            
-            # Add filters if provided
-            if filters and 'email' in filters:
-                params['filterGroups'] = [
+                'properties': _HUBSPOT_DEFAULT_PROPERTIES,
+                'filterGroups': [
                     {
                         'filters': [
                             {
@@ -243,35 +266,30 @@ class HubSpotConnector(CRMConnector):
                         ]
                     }
                 ]
-                response = requests.post(
-                    url + '/search',
-                    json=params,
-                    headers=self._get_headers(),
-                    timeout=10
-                )
-            else:
-                response = requests.get(
-                    url,
-                    params=params,
-                    headers=self._get_headers(),
-                    timeout=10
-                )
-            
-            response.raise_for_status()
-            
-            if 'search' in response.request.url:
-                return response.json().get('results', [])
-            else:
-                return response.json().get('results', [])
+            }
+            response = requests.post(
+                url + '/search',
+                json=params,
+                headers=self._get_headers(),
+                timeout=10,
+                stream=True
+            )
+        else:
+            response = requests.get(
+                f"{url}?{_LIST_QS}",
+                headers=self._get_headers(),
+                timeout=10,
+                stream=True
+            )
         
-        except Exception as e:
-            self.logger.error(f"Error listing HubSpot contacts: {e}")
-            return []
+        with response:
+            response.raise_for_status()
+            yield from iter_json_items(response, 'results')
     
     def test_connection(self) -> bool:
         """Test HubSpot connection"""
         try:
-            url = f"{self.base_url}/crm/v3/objects/contacts"
+            url = f"{self.base_url}{CONTACTS_URL}"
             response = requests.get(
                 url,
                 params={'limit': 1},
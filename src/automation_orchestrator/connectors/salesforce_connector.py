@@ -4,15 +4,21 @@ Integration with Salesforce using REST API
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 import requests
-from automation_orchestrator.crm_connector import CRMConnector
+from automation_orchestrator.crm_connector import (
+    CRMConnector, queue_audit_event, iter_json_items
+)
 from automation_orchestrator.audit import get_audit_logger
 from automation_orchestrator.security import SecretManager
 
 logger = logging.getLogger(__name__)
 audit = get_audit_logger()
 
+# PERFORMANCE: Constant SOQL fragments built once at import
+_LEAD_SELECT = "SELECT Id, FirstName, LastName, Email, Phone, Company, LeadSource FROM Lead"
+_LEAD_LIST_SOQL = f"{_LEAD_SELECT} LIMIT 100"
+
 
 class SalesforceConnector(CRMConnector):
     """Salesforce CRM connector implementation"""
@@ -73,14 +79,16 @@ class SalesforceConnector(CRMConnector):
             
             self.access_token = response.json()['access_token']
             self.logger.info("Successfully authenticated with Salesforce")
-            audit.log_event(
+            queue_audit_event(
+                self.audit,
                 event_type="crm_authenticated",
                 details={"crm": "salesforce"}
             )
         
         except Exception as e:
             self.logger.error(f"Salesforce authentication failed: {e}")
-            audit.log_event(
+            queue_audit_event(
+                self.audit,
                 event_type="error",
                 details={"error": str(e), "operation": "salesforce_auth"}
             )
@@ -236,36 +244,51 @@ class SalesforceConnector(CRMConnector):
             List of leads
         """
         try:
-            soql = "SELECT Id, FirstName, LastName, Email, Phone, Company, LeadSource FROM Lead"
-            
-            # Add filters
-            where_clauses = []
-            if filters:
-                if 'email' in filters:
-                    where_clauses.append(f"Email = '{filters['email']}'")
-                if 'source' in filters:
-                    where_clauses.append(f"LeadSource = '{filters['source']}'")
-            
-            if where_clauses:
-                soql += " WHERE " + " AND ".join(where_clauses)
-            
-            soql += " LIMIT 100"
-            
-            url = f"{self.base_url}/services/data/v57.0/sobjects/Lead"
-            response = requests.get(
-                url,
-                params={'q': soql},
-                headers=self._get_headers(),
-                timeout=10
-            )
-            response.raise_for_status()
-            
-            return response.json().get('records', [])
+            return list(self.iter_leads(filters))
         
         except Exception as e:
             self.logger.error(f"Error listing Salesforce leads: {e}")
             return []
     
+    def iter_leads(self, filters: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream leads from Salesforce one record at a time
+        
+        Args:
+            filters: Optional filters (source, email, etc.)
+        
+        Yields:
+            Lead records
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        soql = _LEAD_LIST_SOQL
+        
+        # Add filters
+        where_clauses = []
+        if filters:
+            if 'email' in filters:
+                where_clauses.append(f"Email = '{filters['email']}'")
+            if 'source' in filters:
+                where_clauses.append(f"LeadSource = '{filters['source']}'")
+        
+        if where_clauses:
+            soql = f"{_LEAD_SELECT} WHERE {' AND '.join(where_clauses)} LIMIT 100"
+        
+        url = f"{self.base_url}/services/data/v57.0/sobjects/Lead"
+        response = requests.get(
+            url,
+            params={'q': soql},
+            headers=self._get_headers(),
+            timeout=10,
+            stream=True
+        )
+        
+        with response:
+            response.raise_for_status()
+            yield from iter_json_items(response, 'records')
+    
     def test_connection(self) -> bool:
         """Test Salesforce connection"""
         try:
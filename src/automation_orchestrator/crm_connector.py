@@ -3,12 +3,126 @@ CRM Connector Interface
 Generic interface for connecting to various CRM systems
 """
 import logging
-from typing import Dict, List, Any, Optional
+import queue
+import threading
+import time
+from typing import Dict, List, Any, Optional, Iterator
 from abc import ABC, abstractmethod
 import json
 import requests
 from automation_orchestrator.audit import get_audit_logger
 
+# Optional streaming JSON parser for large list responses
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+logger = logging.getLogger(__name__)
+
+# PERFORMANCE: Connector audit events are drained by a background thread so
+# CRM calls return as soon as the HTTP request completes
+AUDIT_QUEUE_SIZE = 10000
+_AUDIT_QUEUE: queue.Queue = queue.Queue(maxsize=AUDIT_QUEUE_SIZE)
+_audit_thread: Optional[threading.Thread] = None
+_audit_thread_lock = threading.Lock()
+audit_events_dropped = 0
+
+
+def _audit_worker() -> None:
+    """Background worker that forwards queued events to the audit logger"""
+    while True:
+        audit, event = _AUDIT_QUEUE.get()
+        try:
+            audit.log_event(**event)
+        except Exception as e:
+            logger.error(f"Failed to write connector audit event: {e}")
+        finally:
+            _AUDIT_QUEUE.task_done()
+
+
+def _ensure_audit_worker() -> None:
+    """Start the audit worker thread on first use"""
+    global _audit_thread
+    
+    if _audit_thread is not None and _audit_thread.is_alive():
+        return
+    
+    with _audit_thread_lock:
+        if _audit_thread is None or not _audit_thread.is_alive():
+            _audit_thread = threading.Thread(target=_audit_worker, daemon=True)
+            _audit_thread.start()
+
+
+def queue_audit_event(audit: Any = None, **event: Any) -> bool:
+    """
+    Queue an audit event without blocking the caller
+    
+    Args:
+        audit: Audit logger to write to (defaults to the global audit logger)
+        **event: Keyword arguments for ``AuditLogger.log_event``
+        
+    Returns:
+        True if queued, False if the queue was full and the event was dropped
+    """
+    global audit_events_dropped
+    
+    _ensure_audit_worker()
+    
+    try:
+        _AUDIT_QUEUE.put_nowait((audit or get_audit_logger(), event))
+        return True
+    except queue.Full:
+        audit_events_dropped += 1
+        logger.warning(
+            f"Audit queue full, dropped {event.get('event_type')} event "
+            f"({audit_events_dropped} dropped total)"
+        )
+        return False
+
+
+def iter_json_items(response: requests.Response, key: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items of a top-level JSON array from a streamed response
+    
+    Uses ijson when installed so records are parsed as they arrive instead of
+    loading the whole body into memory first.
+    
+    Args:
+        response: Response opened with ``stream=True``
+        key: Top-level key holding the array (e.g. 'results')
+        
+    Yields:
+        Parsed records
+    """
+    if response.status_code == 204:
+        return
+    
+    if HAS_IJSON:
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+    else:
+        yield from response.json().get(key, [])
+
+
+def flush_audit(timeout: float = 5.0) -> bool:
+    """
+    Wait for queued connector audit events to be written
+    
+    Args:
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        True if the queue was drained, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while _AUDIT_QUEUE.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
 
 class CRMConnector(ABC):
     """Abstract base class for CRM connectors"""
@@ -4,14 +4,69 @@ Detects and merges duplicate leads based on configurable rules
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from collections import defaultdict
+from itertools import compress
+from typing import Dict, List, Any, Optional, Set, Tuple, NamedTuple
 from difflib import SequenceMatcher
 from automation_orchestrator.audit import get_audit_logger
 import re
 
+# Optional C-accelerated fuzzy matching
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# Optional numpy for batched similarity matrices (rapidfuzz.process.cdist)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 audit = get_audit_logger()
 
+# Number of leading/trailing first and last name characters used to block
+# fuzzy candidates
+FUZZY_BLOCK_CHARS = 3
+
+_PHONE_RE = re.compile(r"\D")
+
+# Every byte except ASCII digits, for the bytes.translate() phone fast path
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+class _NormalizedLeads(NamedTuple):
+    """Lead match fields normalized once per batch, one column per field"""
+    emails: List[str]
+    phones: List[str]
+    names: List[str]
+
+
+# Soundex digit for each consonant; vowels, h, w and y stay letters
+_SOUNDEX_CODES = str.maketrans("bfpvcgjkqsxzdtlmnr", "111122222222334556")
+
+
+def _soundex(token: str) -> str:
+    """American Soundex code of a lowercase token ("" if it has no letters)"""
+    letters = [c for c in token if c.isalpha()]
+    if not letters:
+        return ""
+    
+    codes = "".join(letters).translate(_SOUNDEX_CODES)
+    digits = []
+    prev = codes[0]
+    for code in codes[1:]:
+        if code.isdigit() and code != prev:
+            digits.append(code)
+        # h and w do not separate letters with the same code; vowels do
+        if code not in "hw":
+            prev = code
+    
+    return (letters[0] + "".join(digits) + "000")[:4]
+
 
 class DeduplicationEngine:
     """Intelligent lead deduplication with configurable strategies"""
@@ -33,6 +88,18 @@ class DeduplicationEngine:
         self.config = config or self._default_config()
         self.logger = logging.getLogger(__name__)
         self.audit = audit
+        
+        # PERFORMANCE: Resolve configured strategies to matchers once
+        strategy_map = {
+            "email": self._match_email,
+            "phone": self._match_phone,
+            "fuzzy": self._match_fuzzy
+        }
+        self._strategy_fns = {
+            strategy: strategy_map[strategy]
+            for strategy in self.config.get("strategies", ["email"])
+            if strategy in strategy_map
+        }
     
     @staticmethod
     def _default_config() -> Dict[str, Any]:
@@ -50,6 +117,12 @@ class DeduplicationEngine:
         """
         Find duplicate groups in a list of leads
         
+        Leads are first bucketed by cheap blocking keys (normalized email,
+        normalized phone, first/last name prefixes, suffixes and Soundex) so
+        only leads sharing a bucket are compared. Groups are then formed as the
+        pairwise scan did: each lead, in order, claims every later unclaimed
+        lead it matches directly, so matches are not chained transitively.
+        
         Args:
             leads: List of lead dictionaries
         
@@ -59,28 +132,142 @@ class DeduplicationEngine:
         if not self.config.get("enabled"):
             return []
         
-        duplicates = []
-        checked = set()
+        norm = self._normalize_leads(leads)
+        # matches[i] holds every j > i that lead i matches under any strategy
+        matches: Dict[int, Set[int]] = defaultdict(set)
         
-        for i, lead1 in enumerate(leads):
-            if i in checked:
-                continue
-            
-            group = [i]
-            
-            for j, lead2 in enumerate(leads[i+1:], start=i+1):
-                if j in checked:
+        for strategy, match in self._strategy_fns.items():
+            for indices in self._block(norm, strategy).values():
+                if len(indices) < 2:
+                    continue
+                
+                if strategy != "fuzzy":
+                    # Email/phone bucket keys already imply an exact match
+                    for a, i in enumerate(indices):
+                        matches[i].update(indices[a + 1:])
+                    continue
+                
+                if HAS_RAPIDFUZZ and HAS_NUMPY:
+                    self._match_fuzzy_bucket(norm, indices, matches)
                     continue
                 
-                if self._are_duplicates(lead1, lead2):
-                    group.append(j)
-                    checked.add(j)
+                for a, i in enumerate(indices):
+                    for j in indices[a + 1:]:
+                        if j not in matches[i] and match(norm, i, j):
+                            matches[i].add(j)
+        
+        return self._group_matches(len(leads), matches)
+    
+    @staticmethod
+    def _group_matches(count: int, matches: Dict[int, Set[int]]) -> List[List[int]]:
+        """
+        Form duplicate groups from direct matches, in lead order
+        
+        Args:
+            count: Number of leads
+            matches: Later leads directly matched by each lead
+        
+        Returns:
+            List of duplicate groups (index groups)
+        """
+        groups = []
+        claimed = bytearray(count)
+        
+        for i in sorted(matches):
+            if claimed[i]:
+                continue
             
+            group = [i] + [j for j in sorted(matches[i]) if not claimed[j]]
             if len(group) > 1:
-                duplicates.append(group)
-                checked.add(i)
+                for j in group:
+                    claimed[j] = 1
+                groups.append(group)
         
-        return duplicates
+        return groups
+    
+    def _match_fuzzy_bucket(self, norm: _NormalizedLeads, indices: List[int],
+                            matches: Dict[int, Set[int]]) -> None:
+        """
+        Score a whole fuzzy bucket in one rapidfuzz.process.cdist call
+        
+        Args:
+            norm: Normalized fields for all leads
+            indices: Indices of the leads in this bucket, ascending
+            matches: Direct matches, updated in place
+        """
+        cutoff = self.config.get("fuzzy_threshold", 0.85) * 100
+        names = [norm.names[i] for i in indices]
+        
+        scores = process.cdist(
+            names, names,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=cutoff,
+            workers=-1
+        )
+        
+        for a, b in np.argwhere(np.triu(scores >= cutoff, k=1)):
+            matches[indices[a]].add(indices[b])
+    
+    def _normalize_leads(self, leads: List[Dict[str, Any]]) -> _NormalizedLeads:
+        """
+        Normalize the fields used by the match strategies
+        
+        Each field is built as its own column in a single pass so blocking
+        and matching read contiguous lists instead of per-lead dicts.
+        
+        Args:
+            leads: List of lead dictionaries
+        
+        Returns:
+            Normalized email, phone and full name columns
+        """
+        return _NormalizedLeads(
+            emails=[(lead.get("email") or "").lower().strip() for lead in leads],
+            phones=[self._normalize_phone(lead.get("phone", "")) for lead in leads],
+            names=[
+                f"{lead.get('first_name', '')} {lead.get('last_name', '')}".lower().strip()
+                for lead in leads
+            ]
+        )
+    
+    @staticmethod
+    def _block(norm: _NormalizedLeads, strategy: str) -> Dict[str, List[int]]:
+        """
+        Group lead indices by the blocking key of one strategy
+        
+        Args:
+            norm: Normalized lead columns
+            strategy: Match strategy ("email", "phone" or "fuzzy")
+        
+        Returns:
+            Mapping of blocking key to lead indices
+        """
+        buckets: Dict[str, List[int]] = defaultdict(list)
+        
+        if strategy == "email":
+            for i, email in enumerate(norm.emails):
+                if email:
+                    buckets[email].append(i)
+        elif strategy == "phone":
+            for i, phone in enumerate(norm.phones):
+                if len(phone) >= 7:
+                    buckets[phone].append(i)
+        elif strategy == "fuzzy":
+            # Several keys per lead so a typo in one name part still leaves
+            # the pair sharing a bucket through another
+            for i, name in enumerate(norm.names):
+                if len(name) < 3:
+                    continue
+                tokens = name.split()
+                first, last = tokens[0], tokens[-1]
+                buckets["f:" + first[:FUZZY_BLOCK_CHARS]].append(i)
+                buckets["l:" + last[:FUZZY_BLOCK_CHARS]].append(i)
+                buckets["F:" + first[-FUZZY_BLOCK_CHARS:]].append(i)
+                buckets["L:" + last[-FUZZY_BLOCK_CHARS:]].append(i)
+                buckets["s:" + _soundex(first) + _soundex(last)].append(i)
+        
+        return buckets
     
     def _are_duplicates(self, lead1: Dict[str, Any], lead2: Dict[str, Any]) -> bool:
         """
@@ -93,32 +280,25 @@ class DeduplicationEngine:
         Returns:
             True if duplicates, False otherwise
         """
-        strategies = self.config.get("strategies", ["email"])
-        
-        for strategy in strategies:
-            if strategy == "email" and self._match_email(lead1, lead2):
-                return True
-            elif strategy == "phone" and self._match_phone(lead1, lead2):
-                return True
-            elif strategy == "fuzzy" and self._match_fuzzy(lead1, lead2):
-                return True
-        
-        return False
+        norm = self._normalize_leads([lead1, lead2])
+        return any(match(norm, 0, 1) for match in self._strategy_fns.values())
     
-    def _match_email(self, lead1: Dict[str, Any], lead2: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _match_email(norm: _NormalizedLeads, i: int, j: int) -> bool:
         """Check if emails match exactly"""
-        email1 = lead1.get("email", "").lower().strip()
-        email2 = lead2.get("email", "").lower().strip()
+        email1 = norm.emails[i]
+        email2 = norm.emails[j]
         
         if not email1 or not email2:
             return False
         
         return email1 == email2
     
-    def _match_phone(self, lead1: Dict[str, Any], lead2: Dict[str, Any]) -> bool:
-        """Check if phone numbers match (normalize first)"""
-        phone1 = self._normalize_phone(lead1.get("phone", ""))
-        phone2 = self._normalize_phone(lead2.get("phone", ""))
+    @staticmethod
+    def _match_phone(norm: _NormalizedLeads, i: int, j: int) -> bool:
+        """Check if normalized phone numbers match"""
+        phone1 = norm.phones[i]
+        phone2 = norm.phones[j]
         
         if not phone1 or not phone2 or len(phone1) < 7:
             return False
@@ -130,51 +310,59 @@ class DeduplicationEngine:
         """Normalize phone number (digits only)"""
         if not phone:
             return ""
-        return re.sub(r"\D", "", str(phone))
+        phone = str(phone)
+        
+        # PERFORMANCE: ASCII input (the common case) is filtered in C by
+        # bytes.translate; the regex keeps non-ASCII Unicode digits as before
+        if phone.isascii():
+            return phone.encode("ascii").translate(None, _NON_DIGIT_BYTES).decode("ascii")
+        return _PHONE_RE.sub("", phone)
     
-    def _match_fuzzy(self, lead1: Dict[str, Any], lead2: Dict[str, Any]) -> bool:
+    def _match_fuzzy(self, norm: _NormalizedLeads, i: int, j: int) -> bool:
         """
-        Fuzzy match: compare name + email/company
+        Fuzzy match: compare full names
         
         Args:
-            lead1: First lead
-            lead2: Second lead
+            norm: Normalized lead columns
+            i: Index of the first lead
+            j: Index of the second lead
         
         Returns:
             True if fuzzy match score above threshold
         """
         threshold = self.config.get("fuzzy_threshold", 0.85)
-        
-        # Get comparison fields
-        name1 = f"{lead1.get('first_name', '')} {lead1.get('last_name', '')}".lower().strip()
-        name2 = f"{lead2.get('first_name', '')} {lead2.get('last_name', '')}".lower().strip()
+        name1 = norm.names[i]
+        name2 = norm.names[j]
         
         if not name1 or not name2 or len(name1) < 3:
             return False
         
-        # Calculate name similarity
-        similarity = self._string_similarity(name1, name2)
-        
-        # If names are similar, check email or company too
-        if similarity >= threshold:
-            # Check if email or company also matches or is similar
-            email1 = lead1.get("email", "").lower().strip()
-            email2 = lead2.get("email", "").lower().strip()
-            
-            if email1 and email2 and email1 == email2:
-                return True
-            
-            company1 = lead1.get("company", "").lower().strip()
-            company2 = lead2.get("company", "").lower().strip()
-            
-            if company1 and company2 and self._string_similarity(company1, company2) > 0.8:
-                return True
-        
-        return similarity >= threshold
+        return self._string_similarity(name1, name2, threshold) >= threshold
     
     @staticmethod
-    def _string_similarity(s1: str, s2: str) -> float:
-        """Calculate string similarity (0-1)"""
+    def _string_similarity(s1: str, s2: str, score_cutoff: float = 0.0) -> float:
+        """
+        Calculate string similarity (0-1)
+        
+        Uses RapidFuzz's ratio when installed: the same whole-string 2*M/T
+        measure as difflib.SequenceMatcher (computed on the exact LCS), which
+        exits early and reports 0 once the score cannot reach score_cutoff.
+        Falls back to difflib.SequenceMatcher otherwise.
+        """
+        if s1 == s2:
+            return 1.0
+        if not s1 or not s2:
+            return 0.0
+        
+        if HAS_RAPIDFUZZ:
+            return fuzz.ratio(s1, s2, score_cutoff=score_cutoff * 100) / 100.0
+        
+        # SequenceMatcher.ratio() is 2*M/T with M <= the shorter length, so
+        # skip the O(n*m) match when the lengths alone rule out the cutoff
+        lo, hi = sorted((len(s1), len(s2)))
+        if 2.0 * lo / (lo + hi) < score_cutoff:
+            return 0.0
+        
         return SequenceMatcher(None, s1, s2).ratio()
     
     def merge_leads(self, leads: List[Dict[str, Any]], lead_indices: List[int],
@@ -211,14 +399,20 @@ class DeduplicationEngine:
             # Default to first
             base_lead = leads_to_merge[0]
         
-        # Merge data: fill empty fields from other leads
-        merged = base_lead.copy()
-        ignore_fields = self.config.get("ignore_fields", [])
+        # Merge data: each field takes the first non-empty value, base lead
+        # first; ignored fields come from the base lead only
+        ignore_fields = set(self.config.get("ignore_fields", []))
+        priority = [base_lead] + [lead for lead in leads_to_merge if lead is not base_lead]
         
-        for lead in leads_to_merge:
-            for key, value in lead.items():
-                if key not in ignore_fields and not merged.get(key):
-                    merged[key] = value
+        merged = {}
+        for key in dict.fromkeys(key for lead in priority for key in lead):
+            if key in ignore_fields:
+                if key in base_lead:
+                    merged[key] = base_lead[key]
+                continue
+            
+            values = [lead[key] for lead in priority if key in lead]
+            merged[key] = next((value for value in values if value), values[0])
         
         # Add merge metadata
         if self.config.get("track_merge_history"):
@@ -263,21 +457,20 @@ class DeduplicationEngine:
                 "merge_summary": {"total_merged": 0}
             }
         
-        # Track merged leads
+        # Track merged leads (keep[i] is cleared once lead i is merged)
         unique_leads = []
-        merged_indices = set()
+        keep = bytearray(b"\x01") * len(leads)
         merge_count = 0
         
         for group in duplicate_groups:
             merged_lead, _ = self.merge_leads(leads, group)
             unique_leads.append(merged_lead)
-            merged_indices.update(group)
+            for i in group:
+                keep[i] = 0
             merge_count += len(group) - 1
         
-        # Add non-duplicate leads
-        for i, lead in enumerate(leads):
-            if i not in merged_indices:
-                unique_leads.append(lead)
+        # Add non-duplicate leads, in original order
+        unique_leads.extend(compress(leads, keep))
         
         return {
             "unique_leads": unique_leads,
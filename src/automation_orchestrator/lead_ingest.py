@@ -4,19 +4,99 @@ Handles lead capture from web forms and email
 """
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import imaplib
 import email
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.header import decode_header
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import json
 import re
+import math
 import hashlib
+from functools import lru_cache
 from automation_orchestrator.audit import get_audit_logger
 from automation_orchestrator.security import (
     InputValidator, EmailValidator, PIIManager, OutputSanitizer
 )
 
+# Messages fetched per IMAP FETCH round-trip
+IMAP_FETCH_BATCH_SIZE = 100
+
+# Maximum sources fetched concurrently by LeadIngest.fetch_all
+MAX_FETCH_WORKERS = 8
+
+# Processed-ID Bloom filter sizing (~1.8 MB at these defaults)
+PROCESSED_IDS_CAPACITY = 1_000_000
+PROCESSED_IDS_ERROR_RATE = 0.001
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: Tuple[Tuple[str, str], ...]) -> List[Tuple[str, "re.Pattern"]]:
+    """Compile (field_name, pattern) extraction pairs once per pattern set"""
+    return [(field_name, re.compile(pattern, re.IGNORECASE)) for field_name, pattern in patterns]
+
+
+class ProcessedIdFilter:
+    """
+    Bounded-memory set of processed lead IDs backed by a Bloom filter
+    
+    Memory is fixed at construction instead of growing with every lead.
+    Lookups never miss an ID that was added, however long ago, but may
+    report a new ID as already processed (skipping that lead) with
+    probability of about error_rate while fewer than capacity IDs have been
+    added, rising beyond that. Callers should log skips so a falsely
+    skipped lead can be traced.
+    """
+    
+    def __init__(self, capacity: int = PROCESSED_IDS_CAPACITY,
+                 error_rate: float = PROCESSED_IDS_ERROR_RATE):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+    
+    def _positions(self, item: Any) -> List[int]:
+        """Bit positions for an item (double hashing over one BLAKE2b digest)"""
+        digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def __contains__(self, item: Any) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+    
+    def add(self, item: Any) -> None:
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+    
+    def __len__(self) -> int:
+        return self._count
+
+
+@lru_cache(maxsize=4096)
+def _lead_id_hash(email_val: str, timestamp: int) -> str:
+    """
+    Short hash used in generated lead IDs
+    
+    Memoized because leads in a batch share the same timestamp second.
+    Hashes "<email>_<timestamp>", or just the timestamp when email is empty.
+    The ID is not a security token, so a 4-byte BLAKE2b digest gives the
+    8 hex characters directly instead of truncating a full SHA-256.
+    """
+    digest = hashlib.blake2b(digest_size=4)
+    if email_val:
+        digest.update(email_val.encode())
+        digest.update(b"_")
+    digest.update(str(timestamp).encode())
+    return digest.hexdigest()
+
 
 class LeadIngest:
     """Handles lead ingestion from multiple sources"""
@@ -31,8 +111,69 @@ class LeadIngest:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.processed_ids = set()  # Track processed leads to avoid duplicates
+        # Track processed leads to avoid duplicates (bounded memory)
+        self.processed_ids = ProcessedIdFilter()
+        self._processed_lock = threading.Lock()
+        
+        # PERFORMANCE: Keep-alive session so repeated polls reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.1)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+    
+    def _mark_processed(self, lead_id: Any) -> bool:
+        """
+        Record a lead ID as processed
+        
+        Args:
+            lead_id: Lead identifier
+            
+        Returns:
+            True if the ID is new, False if it was already processed
+        """
+        with self._processed_lock:
+            if lead_id in self.processed_ids:
+                # Logged because a rare Bloom false positive also lands here
+                self.logger.info(f"Skipping already processed lead: {lead_id}")
+                return False
+            self.processed_ids.add(lead_id)
+            return True
+    
+    def fetch_all(self, source_configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fetch leads from several sources concurrently
+        
+        Args:
+            source_configs: Source configurations ('web_form' or 'email' type)
+            
+        Returns:
+            Combined list of new leads, in source order
+        """
+        if len(source_configs) <= 1:
+            results = [self._fetch_source(source) for source in source_configs]
+        else:
+            workers = min(MAX_FETCH_WORKERS, len(source_configs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._fetch_source, source_configs))
+        
+        return [lead for leads in results for lead in leads]
+    
+    def _fetch_source(self, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch leads from a single source based on its type"""
+        source_type = source_config.get('type')
+        
+        if source_type == 'web_form':
+            return self.fetch_web_form(source_config)
+        elif source_type == 'email':
+            return self.fetch_email(source_config)
         
+        self.logger.warning(f"Unknown source type: {source_type}")
+        return []
+    
     def fetch_web_form(self, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetch leads from web form API endpoint
@@ -62,10 +203,10 @@ class LeadIngest:
             
             # Make request
             if method == 'GET':
-                response = requests.get(endpoint, headers=headers, auth=auth_tuple, timeout=30)
+                response = self._session.get(endpoint, headers=headers, auth=auth_tuple, timeout=30)
             elif method == 'POST':
-                response = requests.post(endpoint, headers=headers, auth=auth_tuple, 
-                                       json=source_config.get('payload', {}), timeout=30)
+                response = self._session.post(endpoint, headers=headers, auth=auth_tuple, 
+                                              json=source_config.get('payload', {}), timeout=30)
             else:
                 self.logger.error(f"Unsupported HTTP method: {method}")
                 return []
@@ -74,14 +215,10 @@ class LeadIngest:
             
             # Parse response
             data = response.json()
-            leads = self._parse_web_form_response(data, source_config)
-            
-            # Filter out already processed leads
-            new_leads = [lead for lead in leads if lead.get('id') not in self.processed_ids]
+            leads = self._parse_web_form_response(data, source_config, datetime.utcnow().isoformat())
             
-            # Mark as processed
-            for lead in new_leads:
-                self.processed_ids.add(lead.get('id'))
+            # Filter out already processed leads and mark the rest
+            new_leads = [lead for lead in leads if self._mark_processed(lead.get('id'))]
             
             self.logger.info(f"Fetched {len(new_leads)} new leads from web form")
             return new_leads
@@ -93,13 +230,15 @@ class LeadIngest:
             self.logger.error(f"Unexpected error in web form fetch: {e}", exc_info=True)
             return []
     
-    def _parse_web_form_response(self, data: Any, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_web_form_response(self, data: Any, source_config: Dict[str, Any],
+                                 ingested_at: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Parse web form API response into lead objects
         
         Args:
             data: Response data
             source_config: Source configuration
+            ingested_at: Batch ingest timestamp (ISO format, defaults to now)
             
         Returns:
             List of lead dictionaries
@@ -124,6 +263,14 @@ class LeadIngest:
         
         # Map fields
         field_mapping = source_config.get('field_mapping', {})
+        mapping_items = list(field_mapping.items())
+        
+        # PERFORMANCE: Fields shared by every lead in the batch
+        const_fields = {
+            'source': 'web_form',
+            'source_name': source_config.get('name', 'unknown'),
+            'ingested_at': ingested_at or datetime.utcnow().isoformat()
+        }
         
         for item in data:
             # SECURITY: Validate item is a dictionary
@@ -131,34 +278,21 @@ class LeadIngest:
                 self.logger.warning(f"Skipping non-dict item: {type(item)}")
                 continue
             
-            lead = {
-                'id': self._generate_lead_id(item, source_config),
-                'source': 'web_form',
-                'source_name': source_config.get('name', 'unknown'),
-                'ingested_at': datetime.utcnow().isoformat()
-            }
+            lead = {'id': self._generate_lead_id(item, source_config), **const_fields}
             
-            # Apply field mapping with validation
-            if field_mapping:
-                for dest_field, source_field in field_mapping.items():
-                    value = item.get(source_field, '')
-                    # Validate specific fields
-                    if dest_field == 'email' and value:
-                        try:
-                            value = EmailValidator.validate_email(value)
-                        except ValueError as e:
-                            self.logger.warning(f"Invalid email in lead: {e}")
-                            value = None
-                    lead[dest_field] = value
+            # Apply field mapping (no mapping - use all fields)
+            if mapping_items:
+                lead.update({dest: item.get(src, '') for dest, src in mapping_items})
             else:
-                # No mapping - use all fields but validate
-                for key, value in item.items():
-                    if key == 'email' and value:
-                        try:
-                            value = EmailValidator.validate_email(value)
-                        except ValueError:
-                            value = None
-                    lead[key] = value
+                lead.update(item)
+            
+            # SECURITY: Validate email field
+            if lead.get('email'):
+                try:
+                    lead['email'] = EmailValidator.validate_email(lead['email'])
+                except ValueError as e:
+                    self.logger.warning(f"Invalid email in lead: {e}")
+                    lead['email'] = None
             
             leads.append(lead)
         
@@ -201,33 +335,59 @@ class LeadIngest:
                 return []
             
             leads = []
+            all_ids = message_ids[0].split()
+            ingested_at = datetime.utcnow().isoformat()
+            mark_as_read = source_config.get('mark_as_read', True)
             
-            for msg_id in message_ids[0].split():
+            # PERFORMANCE: One FETCH per batch of messages instead of one per
+            # message; BODY.PEEK[] leaves \Seen untouched until we store it
+            for start in range(0, len(all_ids), IMAP_FETCH_BATCH_SIZE):
+                batch_ids = b','.join(all_ids[start:start + IMAP_FETCH_BATCH_SIZE])
+                parsed_ids = []
+                
                 try:
-                    # Fetch email
-                    status, msg_data = mail.fetch(msg_id, '(RFC822)')
+                    status, msg_data = mail.fetch(batch_ids, '(BODY.PEEK[])')
                     
                     if status != 'OK':
+                        self.logger.warning(f"IMAP fetch failed for messages {batch_ids!r}: {status}")
                         continue
                     
-                    # Parse email
-                    raw_email = msg_data[0][1]
-                    email_message = email.message_from_bytes(raw_email)
-                    
-                    lead = self._parse_email_to_lead(email_message, source_config)
-                    
-                    if lead and lead.get('id') not in self.processed_ids:
-                        leads.append(lead)
-                        self.processed_ids.add(lead.get('id'))
+                    for part in msg_data:
+                        # Message parts are (envelope, raw bytes) tuples
+                        if not isinstance(part, tuple):
+                            continue
                         
-                        # Mark as read if configured
-                        if source_config.get('mark_as_read', True):
-                            mail.store(msg_id, '+FLAGS', '\\Seen')
+                        msg_id = part[0].split(b' ', 1)[0]
+                        try:
+                            # Parse email
+                            email_message = email.message_from_bytes(part[1])
+                            
+                            lead = self._parse_email_to_lead(email_message, source_config, ingested_at)
+                            
+                            if lead:
+                                parsed_ids.append(msg_id)
+                                if self._mark_processed(lead.get('id')):
+                                    leads.append(lead)
+                        
+                        except Exception as e:
+                            self.logger.error(f"Error parsing email {msg_id}: {e}")
+                    
+                    # Mark only the messages that parsed as read, if configured,
+                    # so failed ones are retried on the next poll
+                    if mark_as_read and parsed_ids:
+                        mail.store(b','.join(parsed_ids), '+FLAGS', '\\Seen')
                 
+                except imaplib.IMAP4.abort as e:
+                    # Connection is unusable; keep the leads gathered so far
+                    self.logger.error(f"IMAP connection lost, stopping fetch: {e}")
+                    break
                 except Exception as e:
-                    self.logger.error(f"Error parsing email {msg_id}: {e}")
+                    self.logger.error(f"Error fetching email batch {batch_ids!r}: {e}", exc_info=True)
             
-            mail.logout()
+            try:
+                mail.logout()
+            except Exception as e:
+                self.logger.warning(f"IMAP logout failed: {e}")
             
             self.logger.info(f"Fetched {len(leads)} new leads from email")
             return leads
@@ -239,13 +399,15 @@ class LeadIngest:
             self.logger.error(f"Error fetching from email: {e}", exc_info=True)
             return []
     
-    def _parse_email_to_lead(self, email_message, source_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _parse_email_to_lead(self, email_message, source_config: Dict[str, Any],
+                             ingested_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Parse email message to lead object
         
         Args:
             email_message: Email message object
             source_config: Source configuration
+            ingested_at: Batch ingest timestamp (ISO format, defaults to now)
             
         Returns:
             Lead dictionary or None
@@ -253,8 +415,7 @@ class LeadIngest:
         try:
             # Extract basic info
             subject = self._decode_header(email_message.get('Subject', ''))
-            from_email = email.utils.parseaddr(email_message.get('From', ''))[1]
-            from_name = email.utils.parseaddr(email_message.get('From', ''))[0]
+            from_name, from_email = email.utils.parseaddr(email_message.get('From', ''))
             date_str = email_message.get('Date', '')
             
             # Extract body
@@ -262,10 +423,10 @@ class LeadIngest:
             if email_message.is_multipart():
                 for part in email_message.walk():
                     if part.get_content_type() == 'text/plain':
-                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
+                        body = self._decode_payload(part)
                         break
             else:
-                body = email_message.get_payload(decode=True).decode('utf-8', errors='ignore')
+                body = self._decode_payload(email_message)
             
             # Parse structured data from email body
             parsed_data = self._extract_fields_from_body(body, source_config)
@@ -278,7 +439,7 @@ class LeadIngest:
                 'name': from_name or parsed_data.get('name', ''),
                 'subject': subject,
                 'message': body,
-                'ingested_at': datetime.utcnow().isoformat()
+                'ingested_at': ingested_at or datetime.utcnow().isoformat()
             }
             
             # Merge parsed data
@@ -290,6 +451,18 @@ class LeadIngest:
             self.logger.error(f"Error parsing email to lead: {e}", exc_info=True)
             return None
     
+    @staticmethod
+    def _decode_payload(part) -> str:
+        """Decode a message part using its declared charset (default utf-8)"""
+        payload = part.get_payload(decode=True)
+        charset = part.get_content_charset() or 'utf-8'
+        
+        try:
+            return payload.decode(charset, errors='replace')
+        except LookupError:
+            # Unknown charset name in the Content-Type header
+            return payload.decode('utf-8', errors='replace')
+    
     def _decode_header(self, header: str) -> str:
         """Decode email header"""
         if not header:
@@ -320,8 +493,10 @@ class LeadIngest:
         fields = {}
         patterns = source_config.get('extraction_patterns', {})
         
-        for field_name, pattern in patterns.items():
-            match = re.search(pattern, body, re.IGNORECASE)
+        # Each field is searched separately so overlapping matches are all
+        # found; only the compilation is shared across calls
+        for field_name, pattern in _compile_patterns(tuple(patterns.items())):
+            match = pattern.search(body)
             if match:
                 fields[field_name] = match.group(1).strip()
         
@@ -353,15 +528,13 @@ class LeadIngest:
         source_name = source_config.get('name', 'web')
         timestamp = int(datetime.utcnow().timestamp())
         
-        # Create safe ID using hashing
+        # Create safe ID using hashing (only valid emails feed the hash)
         if email_val:
             try:
                 EmailValidator.validate_email(email_val)
-                # Use first 3 chars of hash for uniqueness
-                unique_part = hashlib.sha256(f"{email_val}_{timestamp}".encode()).hexdigest()[:8]
             except ValueError:
-                unique_part = hashlib.sha256(str(timestamp).encode()).hexdigest()[:8]
-        else:
-            unique_part = hashlib.sha256(str(timestamp).encode()).hexdigest()[:8]
+                email_val = ''
+        
+        unique_part = _lead_id_hash(email_val, timestamp)
         
         return f"{source_name[:10]}_{unique_part}_{timestamp}"
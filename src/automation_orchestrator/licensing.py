@@ -4,21 +4,45 @@ Licensing and trial management for Automation Orchestrator.
 
 from __future__ import annotations
 
+import atexit
 import base64
 import hashlib
 import hmac
 import json
 import os
+import tempfile
+import time
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 LICENSE_SECRET = os.getenv("LICENSE_SECRET", "change-me-in-production-use-strong-secret")
 DEFAULT_LICENSE_SECRET = "change-me-in-production-use-strong-secret"
+_SECRET_BYTES = LICENSE_SECRET.encode("utf-8")
+# HMAC hashes keys longer than the SHA-256 block size; do it once up front
+_HMAC_KEY = (
+    hashlib.sha256(_SECRET_BYTES).digest() if len(_SECRET_BYTES) > 64 else _SECRET_BYTES
+)
+# Keyed once; copying it skips re-deriving the ipad/opad state per signature
+_HMAC_TEMPLATE = hmac.new(_HMAC_KEY, digestmod="sha256")
+
+# Maximum seconds a computed license status is reused
+STATUS_CACHE_TTL = 60.0
+
+# Base64 padding indexed by len(data) % 4
+_B64_PAD = ("", "===", "==", "=")
 
 
-@dataclass
+@dataclass(frozen=True)
 class LicenseStatus:
     status: str
     trial_days_remaining: int
@@ -37,6 +61,13 @@ class LicenseStatus:
             "demo_mode": self.demo_mode
         }
 
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Serialized to_dict(), computed once per (immutable) status."""
+        if HAS_ORJSON:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+
 
 class LicenseManager:
     """Handles trial and license enforcement."""
@@ -48,8 +79,16 @@ class LicenseManager:
         self.purchase_url = config.get("purchase_url", "https://example.com/buy")
         self.demo_allowlist = config.get("demo_allowlist", self._default_demo_allowlist())
         self.demo_write_allowlist = config.get("demo_write_allowlist", ["/api/license/activate"])
+        self._demo_read_rules = self._compile_allowlist(self.demo_allowlist)
+        self._demo_write_rules = self._compile_allowlist(self.demo_write_allowlist)
         self._state: Dict[str, Any] = {}
+        self._payload_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+        self._status_cache: Optional[Tuple[float, LicenseStatus]] = None
+        self._trial_end_cache: Optional[Tuple[str, datetime, str]] = None
+        self._state_dirty = False
+        self._state_parent_ready = False
         self._load_state()
+        atexit.register(self.flush_state)
 
     def is_default_secret(self) -> bool:
         return LICENSE_SECRET == DEFAULT_LICENSE_SECRET
@@ -58,8 +97,11 @@ class LicenseManager:
         if not self.enabled:
             return
         if not self._state.get("trial_start_at"):
-            now = self._utcnow().isoformat()
-            self._state["trial_start_at"] = now
+            now = self._utcnow()
+            trial_start = now.isoformat()
+            self._state["trial_start_at"] = trial_start
+            self._set_trial_end(trial_start, now)
+            self._status_cache = None
             self._save_state()
 
     def get_status(self) -> LicenseStatus:
@@ -73,11 +115,27 @@ class LicenseManager:
                 demo_mode=False
             )
 
+        # Reuse the last status until its TTL or the next expiry boundary
+        cached = self._status_cache
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        status, valid_for = self._compute_status()
+        self._status_cache = (time.monotonic() + min(STATUS_CACHE_TTL, valid_for), status)
+        return status
+
+    def _compute_status(self) -> Tuple[LicenseStatus, float]:
+        """Compute the current status and how many seconds it stays valid."""
         now = self._utcnow()
         license_payload = self._get_license_payload()
         if license_payload:
             expires_at = license_payload.get("expires_at")
-            if not expires_at or now <= self._parse_dt(expires_at):
+            expires_dt = self._parse_dt(expires_at) if expires_at else None
+            if expires_dt is None or now <= expires_dt:
+                valid_for = (
+                    (expires_dt - now).total_seconds()
+                    if expires_dt is not None else STATUS_CACHE_TTL
+                )
                 return LicenseStatus(
                     status="active",
                     trial_days_remaining=0,
@@ -85,22 +143,24 @@ class LicenseManager:
                     license_expires_at=expires_at,
                     purchase_url=self.purchase_url,
                     demo_mode=False
-                )
+                ), valid_for
 
         trial_start = self._state.get("trial_start_at")
         if trial_start:
-            start_dt = self._parse_dt(trial_start)
-            trial_end = start_dt + timedelta(days=self.trial_days)
+            trial_end, trial_end_iso = self._get_trial_end(trial_start)
             if now <= trial_end:
-                remaining = max(0, (trial_end - now).days)
+                left = trial_end - now
+                remaining = max(0, left.days)
+                # Valid until trial_days_remaining next ticks down
+                valid_for = left.total_seconds() - left.days * 86400
                 return LicenseStatus(
                     status="trial",
                     trial_days_remaining=remaining,
-                    trial_expires_at=trial_end.isoformat(),
+                    trial_expires_at=trial_end_iso,
                     license_expires_at=None,
                     purchase_url=self.purchase_url,
                     demo_mode=False
-                )
+                ), valid_for
 
         return LicenseStatus(
             status="demo",
@@ -109,7 +169,7 @@ class LicenseManager:
             license_expires_at=None,
             purchase_url=self.purchase_url,
             demo_mode=True
-        )
+        ), STATUS_CACHE_TTL
 
     def is_request_allowed(self, path: str, method: str, status: LicenseStatus) -> bool:
         if not self.enabled:
@@ -120,18 +180,33 @@ class LicenseManager:
             return False
 
         if method in {"GET", "HEAD", "OPTIONS"}:
-            return self._path_allowed(path, self.demo_allowlist)
+            return self._path_allowed(path, self._demo_read_rules)
 
-        return self._path_allowed(path, self.demo_write_allowlist)
+        return self._path_allowed(path, self._demo_write_rules)
 
     def activate_license(self, license_key: str) -> Dict[str, Any]:
         payload = self._validate_license_key(license_key)
         self._state["license_key"] = license_key
         self._state["license_payload"] = payload
         self._state["license_activated_at"] = self._utcnow().isoformat()
+        self._payload_cache = (license_key, payload)
+        self._status_cache = None
         self._save_state()
         return payload
 
+    def _get_trial_end(self, trial_start: str) -> Tuple[datetime, str]:
+        cached = self._trial_end_cache
+        if cached is None or cached[0] != trial_start:
+            cached = self._set_trial_end(trial_start, self._parse_dt(trial_start))
+        return cached[1], cached[2]
+
+    def _set_trial_end(self, trial_start: str, start_dt: datetime) -> Tuple[str, datetime, str]:
+        # Trial end is fixed once the trial starts, so derive it and its
+        # ISO form once rather than on every status computation
+        trial_end = start_dt + timedelta(days=self.trial_days)
+        self._trial_end_cache = (trial_start, trial_end, trial_end.isoformat())
+        return self._trial_end_cache
+
     def _get_license_payload(self) -> Optional[Dict[str, Any]]:
         payload = self._state.get("license_payload")
         if payload and isinstance(payload, dict):
@@ -139,10 +214,14 @@ class LicenseManager:
         key = self._state.get("license_key")
         if not key:
             return None
+        if self._payload_cache and self._payload_cache[0] == key:
+            return self._payload_cache[1]
         try:
             payload = self._validate_license_key(key)
+            self._payload_cache = (key, payload)
+            # Derived from license_key, so persisting it can wait for a flush
             self._state["license_payload"] = payload
-            self._save_state()
+            self._state_dirty = True
             return payload
         except ValueError:
             return None
@@ -151,63 +230,106 @@ class LicenseManager:
         if not self.state_path.exists():
             return
         try:
-            self._state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            data = self.state_path.read_bytes()
+            self._state = orjson.loads(data) if HAS_ORJSON else json.loads(data)
         except Exception:
             self._state = {}
 
+    def flush_state(self) -> None:
+        """Write deferred state changes to disk, if any."""
+        if self._state_dirty:
+            self._save_state()
+
     def _save_state(self) -> None:
-        self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        self.state_path.write_text(json.dumps(self._state, indent=2), encoding="utf-8")
+        if not self._state_parent_ready:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self._state_parent_ready = True
+
+        # Write to a temp file and rename so a crash never leaves a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        try:
+            if HAS_ORJSON:
+                data = orjson.dumps(self._state)
+            else:
+                data = json.dumps(self._state, separators=(",", ":")).encode("utf-8")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._state_dirty = False
 
     def _validate_license_key(self, license_key: str) -> Dict[str, Any]:
         if not license_key:
             raise ValueError("License key is required")
 
-        key = license_key.strip()
+        # Copy so callers can store or mutate the payload without touching the cache
+        payload = dict(self._verify_license(license_key.strip()))
+
+        # Expiry depends on the current time, so it is never cached
+        expires_at = payload.get("expires_at")
+        if expires_at and self._utcnow() > self._parse_dt(expires_at):
+            raise ValueError("License has expired")
+
+        return payload
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _verify_license(key: str) -> MappingProxyType:
+        """Check a license key's signature and decode its payload.
+
+        Args:
+            key: Stripped license key, with or without the LIC- prefix
+
+        Returns:
+            Read-only view of the decoded payload
+
+        Raises:
+            ValueError: If the key is malformed or the signature does not match
+        """
+        # PERFORMANCE: Memoized per key string; invalid keys raise and are not cached
         if key.startswith("LIC-"):
             key = key[4:]
 
-        parts = key.split(".")
-        if len(parts) != 2:
+        payload_b64, sep, sig = key.rpartition(".")
+        if not sep or "." in payload_b64:
             raise ValueError("Invalid license key format")
 
-        payload_b64, sig = parts
-        expected_sig = self._sign(payload_b64)
-        if not hmac.compare_digest(sig, expected_sig):
+        try:
+            sig_bytes = LicenseManager._b64url_decode(sig)
+        except ValueError:
+            raise ValueError("Invalid license signature")
+        # Compare raw digests rather than their longer base64 encodings
+        if not hmac.compare_digest(sig_bytes, LicenseManager._sign(payload_b64)):
             raise ValueError("Invalid license signature")
 
-        payload_json = self._b64url_decode(payload_b64).decode("utf-8")
-        payload = json.loads(payload_json)
-
-        expires_at = payload.get("expires_at")
-        if expires_at and self._utcnow() > self._parse_dt(expires_at):
-            raise ValueError("License has expired")
+        payload_json = LicenseManager._b64url_decode(payload_b64).decode("utf-8")
+        return MappingProxyType(json.loads(payload_json))
 
-        return payload
-
-    def _sign(self, payload_b64: str) -> str:
-        digest = hmac.new(
-            LICENSE_SECRET.encode("utf-8"),
-            payload_b64.encode("utf-8"),
-            hashlib.sha256
-        ).digest()
-        return self._b64url_encode(digest)
+    @staticmethod
+    def _sign(payload_b64: str) -> bytes:
+        # PERFORMANCE: Fork the pre-keyed OpenSSL context instead of re-keying
+        h = _HMAC_TEMPLATE.copy()
+        h.update(payload_b64.encode("utf-8"))
+        return h.digest()
 
     @staticmethod
     def _b64url_encode(data: bytes) -> str:
-        return base64.urlsafe_b64encode(data).decode("utf-8").rstrip("=")
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
 
     @staticmethod
     def _b64url_decode(data: str) -> bytes:
-        padding = "=" * (-len(data) % 4)
-        return base64.urlsafe_b64decode(data + padding)
+        return base64.urlsafe_b64decode(data + _B64_PAD[len(data) & 3])
 
     @staticmethod
     def _utcnow() -> datetime:
         return datetime.now(timezone.utc)
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def _parse_dt(value: str) -> datetime:
+        # PERFORMANCE: Only a handful of distinct timestamps are ever parsed
         try:
             return datetime.fromisoformat(value)
         except ValueError:
@@ -237,14 +359,17 @@ class LicenseManager:
         ]
 
     @staticmethod
-    def _path_allowed(path: str, patterns: List[str]) -> bool:
+    def _compile_allowlist(patterns: List[str]) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+        """Split allowlist patterns into exact paths and prefixes ("/" or "*" suffix)."""
+        prefixes = []
         for pattern in patterns:
             if pattern.endswith("/"):
-                if path.startswith(pattern):
-                    return True
-            if pattern.endswith("*"):
-                if path.startswith(pattern[:-1]):
-                    return True
-            if path == pattern:
-                return True
-        return False
+                prefixes.append(pattern)
+            elif pattern.endswith("*"):
+                prefixes.append(pattern[:-1])
+        return frozenset(patterns), tuple(prefixes)
+
+    @staticmethod
+    def _path_allowed(path: str, rules: Tuple[FrozenSet[str], Tuple[str, ...]]) -> bool:
+        exact, prefixes = rules
+        return path in exact or path.startswith(prefixes)
@@ -1,15 +1,105 @@
 import os
 import json
-from flask import Flask, send_from_directory, request, jsonify, make_response
+import hashlib
+import logging
+from flask import Blueprint, Flask, Response, send_from_directory, request, jsonify, make_response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Compute absolute path to frontend/dist
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FRONTEND_DIST = os.path.abspath(os.path.join(BASE_DIR, '../../frontend/dist'))
 
-app = Flask(__name__, static_folder=FRONTEND_DIST, static_url_path="/")
+# Vite emits content-hashed filenames under assets/, so they never go stale
+HASHED_ASSET_PREFIX = "assets/"
+HASHED_ASSET_MAX_AGE = 31536000
+
+
+class OrJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, keeping Flask's type fallbacks."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_SORT_KEYS if self.sort_keys else 0
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class FrontendApp(Flask):
+    """Flask app that lets browsers cache hashed build assets long-term."""
+
+    def get_send_file_max_age(self, filename):
+        if filename and filename.startswith(HASHED_ASSET_PREFIX):
+            return HASHED_ASSET_MAX_AGE
+        return super().get_send_file_max_age(filename)
+
+
+app = FrontendApp(__name__, static_folder=FRONTEND_DIST, static_url_path="/")
+if HAS_ORJSON:
+    app.json = OrJSONProvider(app)
+logger = logging.getLogger(__name__)
+api_bp = Blueprint("api", __name__, url_prefix="/api")
+
+
+def _build_static_index(root):
+    """Collect relative paths of every file under the frontend build."""
+    files = set()
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir():
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file():
+                    files.add(rel)
+    return frozenset(files)
+
+
+# PERFORMANCE: The build output is immutable while serving, so index it once
+# instead of stat()ing the filesystem on every request
+STATIC_FILES = _build_static_index(FRONTEND_DIST)
+INDEX_EXISTS = "index.html" in STATIC_FILES
+
+
+def _load_index(root):
+    """Read index.html into memory and derive its ETag."""
+    with open(os.path.join(root, "index.html"), "rb") as f:
+        body = f.read()
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return body, etag
+
+
+# PERFORMANCE: Keep the SPA shell in memory so fallback routes skip open/fstat
+INDEX_BYTES, INDEX_ETAG = _load_index(FRONTEND_DIST) if INDEX_EXISTS else (None, None)
+INDEX_HEADERS = {"ETag": f'"{INDEX_ETAG}"', "Cache-Control": "no-cache"}
+
+
+def _index_response():
+    if INDEX_ETAG in request.if_none_match:
+        return Response(status=304, headers=INDEX_HEADERS)
+    return Response(INDEX_BYTES, mimetype="text/html", headers=INDEX_HEADERS)
+
+
+def _is_static_file(path):
+    if app.debug:
+        # Pick up rebuilt assets without restarting during development
+        return os.path.isfile(os.path.join(app.static_folder, path))
+    return path in STATIC_FILES
 
 # --- API ROUTES ---
-@app.route("/api/auth/login", methods=["POST"])
+@api_bp.route("/auth/login", methods=["POST"])
 def api_auth_login():
     data = request.get_json()
     username = data.get("username")
@@ -19,7 +109,7 @@ def api_auth_login():
         return jsonify({"token": "demo-token", "user": {"username": "admin"}})
     return jsonify({"error": "Invalid credentials"}), 401
 
-@app.route("/api/auth/me", methods=["GET"])
+@api_bp.route("/auth/me", methods=["GET"])
 def api_auth_me():
     # For demo, just check for a token in the Authorization header or cookie
     auth_header = request.headers.get("Authorization")
@@ -54,35 +144,55 @@ DEMO_WORKFLOWS = [
     {"id": "2", "name": "Re-engagement", "enabled": False, "status": "inactive"}
 ]
 
+DEMO_HEALTH = {
+    "status": "ok",
+    "details": "All systems nominal.",
+    "uptime_seconds": 123456,
+    "version": "1.0.0",
+    "database": {"status": "ok", "details": "Connected"},
+    "queue": {"status": "ok", "details": "No backlog"},
+    "redis": "ok",
+    "queue_depth": 0
+}
+DEMO_API_KEYS = {"keys": ["demo-key-1", "demo-key-2"]}
+
+
+def _dump_json(data):
+    """Serialize demo data once, matching jsonify's sorted compact output."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+# PERFORMANCE: Demo payloads are constant, so serialize them once at import
+_LEADS_JSON = _dump_json(DEMO_LEADS)
+_CAMPAIGNS_JSON = _dump_json(DEMO_CAMPAIGNS)
+_WORKFLOWS_JSON = _dump_json(DEMO_WORKFLOWS)
+_HEALTH_JSON = _dump_json(DEMO_HEALTH)
+_API_KEYS_JSON = _dump_json(DEMO_API_KEYS)
+
 # --- DEMO API ENDPOINTS ---
-@app.route("/api/leads", methods=["GET"])
+@api_bp.route("/leads", methods=["GET"])
 def api_leads():
-    return jsonify(DEMO_LEADS)
+    return Response(_LEADS_JSON, mimetype="application/json")
 
-@app.route("/api/campaigns", methods=["GET"])
+@api_bp.route("/campaigns", methods=["GET"])
 def api_campaigns():
-    return jsonify(DEMO_CAMPAIGNS)
+    return Response(_CAMPAIGNS_JSON, mimetype="application/json")
 
-@app.route("/api/workflows", methods=["GET"])
+@api_bp.route("/workflows", methods=["GET"])
 def api_workflows():
-    return jsonify(DEMO_WORKFLOWS)
+    return Response(_WORKFLOWS_JSON, mimetype="application/json")
 
-@app.route("/api/health/detailed", methods=["GET"])
+@api_bp.route("/health/detailed", methods=["GET"])
 def api_health_detailed():
-    return jsonify({
-        "status": "ok",
-        "details": "All systems nominal.",
-        "uptime_seconds": 123456,
-        "version": "1.0.0",
-        "database": {"status": "ok", "details": "Connected"},
-        "queue": {"status": "ok", "details": "No backlog"},
-        "redis": "ok",
-        "queue_depth": 0
-    })
-
-@app.route("/api/auth/api-keys", methods=["GET"])
+    return Response(_HEALTH_JSON, mimetype="application/json")
+
+@api_bp.route("/auth/api-keys", methods=["GET"])
 def api_auth_api_keys():
-    return jsonify({"keys": ["demo-key-1", "demo-key-2"]})
+    return Response(_API_KEYS_JSON, mimetype="application/json")
+
+app.register_blueprint(api_bp)
 
 # --- STATIC/FRONTEND ROUTES ---
 
@@ -90,30 +200,37 @@ def api_auth_api_keys():
 @app.route("/", defaults={"path": ""})
 @app.route("/<path:path>")
 def catch_all(path):
-    print(f"[DEBUG] Request for: {path}")
+    logger.debug("Request for: %s", path)
     # Serve API routes as normal
     if path.startswith("api/"):
-        print("[DEBUG] API route, not serving frontend.")
+        logger.debug("API route, not serving frontend.")
         return "", 404
     # Serve static files if they exist
-    file_path = os.path.join(app.static_folder, path)
-    if path != "" and os.path.isfile(file_path):
-        print(f"[DEBUG] Serving static file: {file_path}")
+    if path != "" and _is_static_file(path):
+        logger.debug("Serving static file: %s", path)
         return send_from_directory(app.static_folder, path)
     # Otherwise, serve index.html for frontend routing
-    index_path = os.path.join(app.static_folder, "index.html")
-    if os.path.exists(index_path):
-        print(f"[DEBUG] Serving index.html from: {index_path}")
-            # --- DEMO API ENDPOINTS ---
+    if INDEX_BYTES is not None and not app.debug:
+        logger.debug("Serving cached index.html")
+        return _index_response()
+    if _is_static_file("index.html"):
+        logger.debug("Serving index.html")
         return send_from_directory(app.static_folder, "index.html")
     else:
-        print(f"[ERROR] index.html not found at: {index_path}")
+        logger.error("index.html not found in: %s", app.static_folder)
         return "index.html not found", 500
 
 if __name__ == "__main__":
-    print(f"[DEBUG] Serving frontend from: {FRONTEND_DIST}")
+    logging.basicConfig(level=logging.INFO)
+    logger.info("Serving frontend from: %s", FRONTEND_DIST)
     if not os.path.exists(os.path.join(FRONTEND_DIST, "index.html")):
-        print("[ERROR] index.html not found in frontend/dist. Please build the frontend.")
-    app.run(host="0.0.0.0", port=8000)
+        logger.error("index.html not found in frontend/dist. Please build the frontend.")
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress not installed; falling back to the Flask development server")
+        app.run(host="0.0.0.0", port=8000, threaded=True)
+    else:
+        serve(app, host="0.0.0.0", port=8000, threads=8)
 
 
@@ -3,23 +3,58 @@ Production Monitoring and Logging Module
 Comprehensive monitoring, metrics collection, and event tracking for production systems
 """
 
+import atexit
 import logging
 import logging.handlers
 import json
+import math
+import queue
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
-from collections import deque
+from collections import Counter, deque
 from pathlib import Path
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if HAS_ORJSON:
+    # UTC datetimes render with a trailing Z; int keys match json.dumps
+    _ORJSON_LOG_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+_INF = float('inf')
+
+# Seconds a computed metrics summary is reused across callers
+SUMMARY_CACHE_TTL = 0.5
+
+# Fixed log-spaced latency histogram: 0.1ms..10s at 12.8 buckets per decade
+LATENCY_BUCKETS = 64
+_BUCKETS_PER_DECADE = 12.8
+_LATENCY_BUCKET_EDGES = [10 ** (-1 + i / _BUCKETS_PER_DECADE) for i in range(LATENCY_BUCKETS + 1)]
+
+logger = logging.getLogger(__name__)
+workflow_logger = logging.getLogger('workflows')
+
 # Configure JSON logging
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for easier parsing and aggregation"""
     
     def format(self, record):
+        # The record's own creation time, not a fresh clock read per format
+        now = datetime.fromtimestamp(record.created, timezone.utc)
         log_data = {
-            'timestamp': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            # PERFORMANCE: orjson formats the datetime itself; no isoformat + replace
+            'timestamp': now if HAS_ORJSON else now.isoformat().replace('+00:00', 'Z'),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -39,9 +74,42 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'extra_fields'):
             log_data.update(record.extra_fields)
         
+        if HAS_ORJSON:
+            return orjson.dumps(log_data, option=_ORJSON_LOG_OPTIONS).decode('utf-8')
         return json.dumps(log_data)
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched for an in-process QueueListener.
+
+    The stock QueueHandler pre-formats records and strips exc_info so they
+    can be pickled; the listener here shares the process, so the raw record
+    is kept and JSONFormatter can still report the exception.
+    """
+
+    def emit(self, record):
+        try:
+            self.enqueue(record)
+        except Exception:
+            self.handleError(record)
+
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records and stop the background file-logging thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_json_logging(log_dir: str = 'logs', level: int = logging.INFO) -> None:
     """Configure JSON logging for production"""
     
@@ -55,6 +123,7 @@ def setup_json_logging(log_dir: str = 'logs', level: int = logging.INFO) -> None
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_log_listener()
     
     # Console handler (INFO level for production)
     console_handler = logging.StreamHandler()
@@ -73,7 +142,6 @@ def setup_json_logging(log_dir: str = 'logs', level: int = logging.INFO) -> None
     )
     app_log_handler.setLevel(logging.DEBUG)
     app_log_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(app_log_handler)
     
     # Error log file (JSON format, ERROR and CRITICAL only)
     error_handler = logging.handlers.RotatingFileHandler(
@@ -83,7 +151,6 @@ def setup_json_logging(log_dir: str = 'logs', level: int = logging.INFO) -> None
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(error_handler)
     
     # Workflow events log file
     workflow_handler = logging.handlers.RotatingFileHandler(
@@ -93,8 +160,87 @@ def setup_json_logging(log_dir: str = 'logs', level: int = logging.INFO) -> None
     )
     workflow_handler.setLevel(logging.INFO)
     workflow_handler.setFormatter(JSONFormatter())
-    workflow_logger = logging.getLogger('workflows')
-    workflow_logger.addHandler(workflow_handler)
+    # Only records from the 'workflows' logger tree, as when it was attached there
+    workflow_handler.addFilter(logging.Filter('workflows'))
+    
+    # PERFORMANCE: File writes and rollovers run on a listener thread so
+    # logging callers only pay for an enqueue
+    global _log_listener
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, app_log_handler, error_handler, workflow_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+class RequestHistory:
+    """Fixed-size ring buffer of recent requests stored as parallel columns.
+
+    Each field lives in its own preallocated array (numpy when available) and
+    endpoints are interned to small integer ids, so recording a request is a
+    handful of slot writes instead of a dict allocation per request.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._cursor = 0
+        if HAS_NUMPY:
+            self.timestamps = np.zeros(capacity, dtype=np.float64)
+            self.status = np.zeros(capacity, dtype=np.int16)
+            self.latency = np.zeros(capacity, dtype=np.float32)
+            self.endpoint_idx = np.zeros(capacity, dtype=np.int32)
+        else:
+            self.timestamps = [0.0] * capacity
+            self.status = [0] * capacity
+            self.latency = [0.0] * capacity
+            self.endpoint_idx = [0] * capacity
+        # (method, endpoint) <-> id interning table
+        self.endpoint_ids: Dict[tuple, int] = {}
+        self.endpoints: List[tuple] = []
+
+    def intern(self, method: str, endpoint: str) -> int:
+        """Return the integer id for a method/endpoint pair, assigning one if new."""
+        key = (method, endpoint)
+        idx = self.endpoint_ids.get(key)
+        if idx is None:
+            idx = len(self.endpoints)
+            self.endpoint_ids[key] = idx
+            self.endpoints.append(key)
+        return idx
+
+    def append(self, endpoint_idx: int, status_code: int, latency_ms: float,
+               timestamp: float) -> None:
+        slot = self._cursor % self.capacity
+        self.timestamps[slot] = timestamp
+        self.status[slot] = status_code
+        self.latency[slot] = latency_ms
+        self.endpoint_idx[slot] = endpoint_idx
+        self._cursor += 1
+
+    def __len__(self) -> int:
+        return min(self._cursor, self.capacity)
+
+    def _order(self) -> List[int]:
+        """Slot indices from oldest to newest."""
+        n = len(self)
+        start = self._cursor - n
+        return [(start + i) % self.capacity for i in range(n)]
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Materialize the buffer as per-request dicts, oldest first."""
+        out = []
+        for slot in self._order():
+            method, endpoint = self.endpoints[int(self.endpoint_idx[slot])]
+            out.append({
+                'timestamp': datetime.fromtimestamp(float(self.timestamps[slot]), timezone.utc),
+                'endpoint': endpoint,
+                'method': method,
+                'status': int(self.status[slot]),
+                'latency': float(self.latency[slot])
+            })
+        return out
 
 
 # Production-grade metrics collection
@@ -103,7 +249,7 @@ class MetricsCollector:
     
     def __init__(self, max_history: int = 1440):  # 24 hours of 1-min data
         self.max_history = max_history
-        self.request_history = deque(maxlen=max_history)
+        self.history = RequestHistory(max_history)
         self.error_history = deque(maxlen=max_history)
         self.latency_history = deque(maxlen=max_history)
         
@@ -111,59 +257,78 @@ class MetricsCollector:
         self.total_requests = 0
         self.total_errors = 0
         self.total_latency_ms = 0.0
+        # Streaming latency histogram so percentiles never scan history
+        self._latency_hist: List[int] = [0] * LATENCY_BUCKETS
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_cache_ts = 0.0
         
         # Error tracking
-        self.error_types = {}
-        self.endpoint_stats = {}
+        self.error_types: Counter = Counter()
+        # Cumulative per-endpoint stats, indexed by the history's endpoint id
+        self._ep_count: List[int] = []
+        self._ep_errors: List[int] = []
+        self._ep_latency: List[float] = []
+        self._ep_max: List[float] = []
+        self._ep_min: List[float] = []
         
-        logger = logging.getLogger(__name__)
         logger.info("MetricsCollector initialized")
     
     def record_request(self, endpoint: str, method: str, status_code: int, 
-                      latency_ms: float, error: Optional[str] = None):
-        """Record API request metrics"""
+                      latency_ms: float, error: Optional[str] = None,
+                      now: Optional[float] = None):
+        """Record API request metrics
+        
+        Args:
+            now: Epoch timestamp of the request if the caller already has one
+        """
         self.total_requests += 1
         self.total_latency_ms += latency_ms
         
-        if status_code >= 400:
-            self.total_errors += 1
-            if error:
-                self.error_types[error] = self.error_types.get(error, 0) + 1
+        bucket = int((math.log10(latency_ms) + 1) * _BUCKETS_PER_DECADE) if latency_ms > 0.1 else 0
+        self._latency_hist[bucket if bucket < LATENCY_BUCKETS else LATENCY_BUCKETS - 1] += 1
         
         # Track endpoint statistics
-        key = f"{method} {endpoint}"
-        if key not in self.endpoint_stats:
-            self.endpoint_stats[key] = {
-                'count': 0,
-                'errors': 0,
-                'total_latency': 0,
-                'max_latency': 0,
-                'min_latency': float('inf')
-            }
+        history = self.history
+        idx = history.intern(method, endpoint)
+        ep_count = self._ep_count
+        if idx == len(ep_count):
+            ep_count.append(0)
+            self._ep_errors.append(0)
+            self._ep_latency.append(0.0)
+            self._ep_max.append(0.0)
+            self._ep_min.append(_INF)
         
-        stats = self.endpoint_stats[key]
-        stats['count'] += 1
-        stats['total_latency'] += latency_ms
-        stats['max_latency'] = max(stats['max_latency'], latency_ms)
-        stats['min_latency'] = min(stats['min_latency'], latency_ms)
+        # PERFORMANCE: Locals and plain comparisons instead of max()/min() calls
+        ep_count[idx] += 1
+        self._ep_latency[idx] += latency_ms
+        ep_max = self._ep_max
+        if latency_ms > ep_max[idx]:
+            ep_max[idx] = latency_ms
+        ep_min = self._ep_min
+        if latency_ms < ep_min[idx]:
+            ep_min[idx] = latency_ms
         
         if status_code >= 400:
-            stats['errors'] += 1
+            self.total_errors += 1
+            self._ep_errors[idx] += 1
+            if error:
+                self.error_types[error] += 1
         
         # Store in history
-        self.request_history.append({
-            'timestamp': datetime.now(timezone.utc),
-            'endpoint': endpoint,
-            'method': method,
-            'status': status_code,
-            'latency': latency_ms
-        })
+        history.append(idx, status_code, latency_ms, time.time() if now is None else now)
+    
+    @property
+    def request_history(self) -> List[Dict[str, Any]]:
+        """Recent requests as dicts, oldest first."""
+        return self.history.records()
     
     def record_workflow_execution(self, workflow_id: str, duration_ms: float, 
                                  success: bool, error: Optional[str] = None):
         """Record workflow execution metrics"""
-        logger = logging.getLogger('workflows')
-        logger.info(
+        # PERFORMANCE: Skip building the extras payload when INFO is filtered out
+        if not workflow_logger.isEnabledFor(logging.INFO):
+            return
+        workflow_logger.info(
             f"Workflow execution: {workflow_id}",
             extra={
                 'extra_fields': {
@@ -177,6 +342,16 @@ class MetricsCollector:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get current metrics summary"""
+        # PERFORMANCE: Scrapes, alert checks and exports within the TTL share
+        # one aggregation; callers get copies of the levels they annotate
+        now = time.monotonic()
+        cached = self._summary_cache
+        if cached is None or now - self._summary_cache_ts >= SUMMARY_CACHE_TTL:
+            cached = self._summary_cache = self._build_summary()
+            self._summary_cache_ts = now
+        return {**cached, 'metrics': dict(cached['metrics'])}
+    
+    def _build_summary(self) -> Dict[str, Any]:
         uptime_seconds = time.time() - self.start_time
         
         avg_latency = (self.total_latency_ms / self.total_requests) if self.total_requests > 0 else 0
@@ -192,31 +367,75 @@ class MetricsCollector:
                 'error_rate_percent': round(error_rate, 2),
                 'success_rate_percent': round(success_rate, 2),
                 'avg_latency_ms': round(avg_latency, 2),
-                'total_latency_ms': round(self.total_latency_ms, 2)
+                'total_latency_ms': round(self.total_latency_ms, 2),
+                **self._get_latency_percentiles()
             },
             'error_breakdown': self._get_top_errors(5),
             'endpoint_performance': self._get_endpoint_stats()
         }
     
+    def _get_latency_percentiles(self) -> Dict[str, float]:
+        """Approximate p50/p95/p99 latency from the streaming histogram
+        
+        Each percentile is reported as the upper edge of the bucket that
+        contains it, so values are conservative to within one bucket (~20%).
+        """
+        total = sum(self._latency_hist)
+        result = {}
+        for name, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+            value = 0.0
+            if total:
+                rank = math.ceil(total * fraction)
+                seen = 0
+                for bucket, count in enumerate(self._latency_hist):
+                    seen += count
+                    if seen >= rank:
+                        value = _LATENCY_BUCKET_EDGES[bucket + 1]
+                        break
+            result[f'{name}_latency_ms'] = round(value, 2)
+        return result
+    
     def _get_top_errors(self, limit: int = 5) -> Dict[str, int]:
         """Get top error types"""
-        sorted_errors = sorted(self.error_types.items(), key=lambda x: x[1], reverse=True)
-        return dict(sorted_errors[:limit])
+        # most_common(n) selects with a heap rather than sorting every error type
+        return dict(self.error_types.most_common(limit))
     
     def _get_endpoint_stats(self) -> Dict[str, Any]:
         """Get endpoint performance statistics"""
-        stats = {}
-        for endpoint, data in list(self.endpoint_stats.items()):
-            if data['count'] > 0:
-                stats[endpoint] = {
-                    'requests': data['count'],
-                    'errors': data['errors'],
-                    'error_rate_percent': round(data['errors'] / data['count'] * 100, 2),
-                    'avg_latency_ms': round(data['total_latency'] / data['count'], 2),
-                    'max_latency_ms': round(data['max_latency'], 2),
-                    'min_latency_ms': round(data['min_latency'], 2)
-                }
-        return stats
+        # Recording and summaries both run on the event loop, so the columns
+        # are read in place rather than snapshotted first
+        if not self._ep_count:
+            return {}
+        keys = [f"{method} {endpoint}" for method, endpoint in self.history.endpoints]
+        
+        if HAS_NUMPY:
+            # PERFORMANCE: One vectorized pass per column instead of per-endpoint math
+            counts = np.asarray(self._ep_count, dtype=np.float64)
+            errors = np.asarray(self._ep_errors, dtype=np.float64)
+            error_rates = np.round(errors / counts * 100, 2).tolist()
+            avg_latency = np.round(np.asarray(self._ep_latency) / counts, 2).tolist()
+            max_latency = np.round(np.asarray(self._ep_max), 2).tolist()
+            min_latency = np.round(np.asarray(self._ep_min), 2).tolist()
+        else:
+            error_rates = [round(e / c * 100, 2) for e, c in zip(self._ep_errors, self._ep_count)]
+            avg_latency = [round(t / c, 2) for t, c in zip(self._ep_latency, self._ep_count)]
+            max_latency = [round(v, 2) for v in self._ep_max]
+            min_latency = [round(v, 2) for v in self._ep_min]
+        
+        return {
+            key: {
+                'requests': count,
+                'errors': errs,
+                'error_rate_percent': rate,
+                'avg_latency_ms': avg,
+                'max_latency_ms': hi,
+                'min_latency_ms': lo
+            }
+            for key, count, errs, rate, avg, hi, lo in zip(
+                keys, self._ep_count, self._ep_errors, error_rates,
+                avg_latency, max_latency, min_latency
+            )
+        }
     
     def export_daily_summary(self, output_dir: str = 'metrics') -> str:
         """Export daily metrics summary to file"""
@@ -228,10 +447,13 @@ class MetricsCollector:
         summary = self.get_summary()
         summary['export_date'] = today
         
-        with open(filepath, 'w') as f:
-            json.dump(summary, f, indent=2)
+        if HAS_ORJSON:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | _ORJSON_LOG_OPTIONS))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(summary, f, indent=2)
         
-        logger = logging.getLogger(__name__)
         logger.info(f"Metrics exported to {filepath}")
         
         return str(filepath)
@@ -249,17 +471,17 @@ class AlertManager:
             'queue_depth_high': 1000,
             'database_timeout': 5000,  # ms
         }
-        logger = logging.getLogger(__name__)
         logger.info("AlertManager initialized")
     
     def check_thresholds(self, metrics: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Check metrics against thresholds and generate alerts"""
         alerts = []
+        timestamp = datetime.now(timezone.utc).isoformat()
         
         error_rate = metrics['metrics']['error_rate_percent']
         if error_rate > self.thresholds['error_rate_high']:
             alert = {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': timestamp,
                 'severity': 'HIGH',
                 'type': 'error_rate_high',
                 'message': f'Error rate {error_rate}% exceeds threshold {self.thresholds["error_rate_high"]}%',
@@ -272,7 +494,7 @@ class AlertManager:
         avg_latency = metrics['metrics']['avg_latency_ms']
         if avg_latency > self.thresholds['latency_high']:
             alert = {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': timestamp,
                 'severity': 'MEDIUM',
                 'type': 'latency_high',
                 'message': f'Average latency {avg_latency}ms exceeds threshold {self.thresholds["latency_high"]}ms',
@@ -286,7 +508,8 @@ class AlertManager:
     
     def _log_alert(self, alert: Dict[str, Any]):
         """Log alert event"""
-        logger = logging.getLogger(__name__)
+        if not logger.isEnabledFor(logging.WARNING):
+            return
         logger.warning(
             f"ALERT: {alert['type']}",
             extra={
@@ -305,7 +528,6 @@ class PerformanceTracker:
     
     def __init__(self):
         self.operations = {}
-        logger = logging.getLogger(__name__)
         logger.info("PerformanceTracker initialized")
     
     def record_operation(self, operation_name: str, duration_ms: float, 
@@ -332,7 +554,8 @@ class PerformanceTracker:
         else:
             op['failures'] += 1
         
-        logger = logging.getLogger(__name__)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(
             f"Operation: {operation_name}",
             extra={
@@ -4,16 +4,97 @@ Provides tenant isolation and multi-tenant support
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from uuid import uuid4
 import hashlib
 
+# Optional Arrow support for columnar tenant filtering
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 logger = logging.getLogger(__name__)
 
+# PERFORMANCE: Plan tables are built once; tenants get their own copy of a
+# plan's rate-limit and feature entries so per-tenant overrides stay local
+_PLAN_MAX_USERS: Dict[str, int] = {
+    "free": 1,
+    "starter": 3,
+    "pro": 10,
+    "enterprise": 999
+}
+
+_PLAN_MAX_LEADS: Dict[str, int] = {
+    "free": 100,
+    "starter": 10000,
+    "pro": 100000,
+    "enterprise": 999999
+}
+
+_PLAN_RATE_LIMITS: Dict[str, Mapping[str, int]] = {
+    plan: MappingProxyType(limits) for plan, limits in {
+        "free": {"requests_per_second": 10, "leads_per_month": 100},
+        "starter": {"requests_per_second": 50, "leads_per_month": 10000},
+        "pro": {"requests_per_second": 200, "leads_per_month": 100000},
+        "enterprise": {"requests_per_second": 1000, "leads_per_month": 999999}
+    }.items()
+}
+
+_PLAN_FEATURES: Dict[str, Mapping[str, bool]] = {
+    plan: MappingProxyType(features) for plan, features in {
+        "free": {
+            "api_access": True,
+            "salesforce_sync": False,
+            "hubspot_sync": False,
+            "analytics": False,
+            "rbac": False,
+            "custom_branding": False
+        },
+        "starter": {
+            "api_access": True,
+            "salesforce_sync": True,
+            "hubspot_sync": False,
+            "analytics": True,
+            "rbac": True,
+            "custom_branding": False
+        },
+        "pro": {
+            "api_access": True,
+            "salesforce_sync": True,
+            "hubspot_sync": True,
+            "analytics": True,
+            "rbac": True,
+            "custom_branding": True
+        },
+        "enterprise": {
+            "api_access": True,
+            "salesforce_sync": True,
+            "hubspot_sync": True,
+            "analytics": True,
+            "rbac": True,
+            "custom_branding": True,
+            "sso": True,
+            "dedicated_support": True
+        }
+    }.items()
+}
+
 
 class Tenant:
     """Represents a customer/organization (tenant)"""
     
+    # PERFORMANCE: Slots avoid a per-tenant __dict__
+    __slots__ = (
+        'tenant_id', 'name', 'owner_id', 'plan', 'max_leads', 'max_users',
+        'active', 'created_at', 'updated_at', 'settings', 'rate_limit'
+    )
+    
     def __init__(self, tenant_id: str, name: str, owner_id: str,
                  plan: str = "starter", max_leads: int = 10000):
         self.tenant_id = tenant_id
@@ -41,65 +122,17 @@ class Tenant:
     @staticmethod
     def _get_max_users_for_plan(plan: str) -> int:
         """Get max users for plan"""
-        plans = {
-            "free": 1,
-            "starter": 3,
-            "pro": 10,
-            "enterprise": 999
-        }
-        return plans.get(plan, 3)
+        return _PLAN_MAX_USERS.get(plan, 3)
     
     @staticmethod
     def _get_rate_limit_for_plan(plan: str) -> Dict[str, int]:
         """Get rate limits for plan"""
-        plans = {
-            "free": {"requests_per_second": 10, "leads_per_month": 100},
-            "starter": {"requests_per_second": 50, "leads_per_month": 10000},
-            "pro": {"requests_per_second": 200, "leads_per_month": 100000},
-            "enterprise": {"requests_per_second": 1000, "leads_per_month": 999999}
-        }
-        return plans.get(plan, plans["starter"])
+        return dict(_PLAN_RATE_LIMITS.get(plan, _PLAN_RATE_LIMITS["starter"]))
     
     @staticmethod
     def _get_features_for_plan(plan: str) -> Dict[str, bool]:
         """Get enabled features for plan"""
-        features = {
-            "free": {
-                "api_access": True,
-                "salesforce_sync": False,
-                "hubspot_sync": False,
-                "analytics": False,
-                "rbac": False,
-                "custom_branding": False
-            },
-            "starter": {
-                "api_access": True,
-                "salesforce_sync": True,
-                "hubspot_sync": False,
-                "analytics": True,
-                "rbac": True,
-                "custom_branding": False
-            },
-            "pro": {
-                "api_access": True,
-                "salesforce_sync": True,
-                "hubspot_sync": True,
-                "analytics": True,
-                "rbac": True,
-                "custom_branding": True
-            },
-            "enterprise": {
-                "api_access": True,
-                "salesforce_sync": True,
-                "hubspot_sync": True,
-                "analytics": True,
-                "rbac": True,
-                "custom_branding": True,
-                "sso": True,
-                "dedicated_support": True
-            }
-        }
-        return features.get(plan, features["starter"])
+        return dict(_PLAN_FEATURES.get(plan, _PLAN_FEATURES["starter"]))
     
     def has_feature(self, feature: str) -> bool:
         """Check if tenant has feature enabled"""
@@ -127,7 +160,11 @@ class TenantManager:
     
     def __init__(self):
         self.tenants: Dict[str, Tenant] = {}
-        self.tenant_users: Dict[str, List[str]] = {}  # tenant_id -> [user_ids]
+        # Dicts used as insertion-ordered sets: O(1) membership, stable order
+        self.tenant_users: Dict[str, Dict[str, None]] = {}  # tenant_id -> {user_ids}
+        # Reverse index so user lookups don't scan every tenant
+        self.user_tenants: Dict[str, Dict[str, None]] = defaultdict(dict)  # user_id -> {tenant_ids}
+        self._tenant_order: Dict[str, int] = {}  # tenant_id -> creation order
         self.logger = logging.getLogger(__name__)
     
     def create_tenant(self, name: str, owner_id: str, plan: str = "starter") -> Tenant:
@@ -136,7 +173,9 @@ class TenantManager:
         
         tenant = Tenant(tenant_id, name, owner_id, plan)
         self.tenants[tenant_id] = tenant
-        self.tenant_users[tenant_id] = [owner_id]
+        self._tenant_order[tenant_id] = len(self._tenant_order)
+        self.tenant_users[tenant_id] = {owner_id: None}
+        self.user_tenants[owner_id][tenant_id] = None
         
         self.logger.info(f"Created tenant {name} ({tenant_id}) with plan {plan}")
         return tenant
@@ -162,13 +201,7 @@ class TenantManager:
     @staticmethod
     def _get_max_leads_for_plan(plan: str) -> int:
         """Get max leads for plan"""
-        plans = {
-            "free": 100,
-            "starter": 10000,
-            "pro": 100000,
-            "enterprise": 999999
-        }
-        return plans.get(plan, 10000)
+        return _PLAN_MAX_LEADS.get(plan, 10000)
     
     def deactivate_tenant(self, tenant_id: str) -> bool:
         """Deactivate tenant"""
@@ -196,7 +229,8 @@ class TenantManager:
             return False
         
         if user_id not in self.tenant_users[tenant_id]:
-            self.tenant_users[tenant_id].append(user_id)
+            self.tenant_users[tenant_id][user_id] = None
+            self.user_tenants[user_id][tenant_id] = None
             self.logger.info(f"Added user {user_id} to tenant {tenant_id}")
         
         return True
@@ -207,18 +241,23 @@ class TenantManager:
             return False
         
         if user_id in self.tenant_users[tenant_id]:
-            self.tenant_users[tenant_id].remove(user_id)
+            del self.tenant_users[tenant_id][user_id]
+            self.user_tenants[user_id].pop(tenant_id, None)
             self.logger.info(f"Removed user {user_id} from tenant {tenant_id}")
         
         return True
     
     def get_tenant_users(self, tenant_id: str) -> List[str]:
-        """Get all users in tenant"""
-        return self.tenant_users.get(tenant_id, [])
+        """Get all users in tenant (owner first, then in join order)"""
+        return list(self.tenant_users.get(tenant_id, ()))
+    
+    def is_tenant_user(self, tenant_id: str, user_id: str) -> bool:
+        """Check whether user belongs to tenant"""
+        return user_id in self.tenant_users.get(tenant_id, ())
     
     def get_user_tenants(self, user_id: str) -> List[str]:
-        """Get all tenants for a user"""
-        return [tid for tid, users in self.tenant_users.items() if user_id in users]
+        """Get all tenants for a user, in tenant creation order"""
+        return sorted(self.user_tenants.get(user_id, ()), key=self._tenant_order.__getitem__)
     
     def list_tenants(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """List all tenants"""
@@ -271,8 +310,7 @@ class TenantDataIsolation:
     
     def validate_tenant_access(self, tenant_id: str, user_id: str) -> bool:
         """Validate that user has access to tenant"""
-        users = self.tenant_manager.get_tenant_users(tenant_id)
-        return user_id in users
+        return self.tenant_manager.is_tenant_user(tenant_id, user_id)
     
     def enforce_isolation(self, records: List[Dict[str, Any]], 
                          tenant_id: str) -> List[Dict[str, Any]]:
@@ -280,6 +318,24 @@ class TenantDataIsolation:
         # Only return records belonging to this tenant
         return [r for r in records if r.get("tenant_id") == tenant_id]
     
+    def enforce_isolation_columnar(self, table: "pa.Table", tenant_id: str) -> "pa.Table":
+        """Enforce tenant isolation on an Arrow table
+        
+        Args:
+            table: Records as a pyarrow Table with a tenant_id column
+            tenant_id: Tenant whose rows should be kept
+        
+        Returns:
+            Table containing only the tenant's rows
+        """
+        if not HAS_PYARROW:
+            raise RuntimeError("pyarrow not installed")
+        if "tenant_id" not in table.column_names:
+            return table.slice(0, 0)
+        # PERFORMANCE: One vectorized comparison instead of a per-row dict lookup;
+        # null tenant_ids compare as null and are dropped by filter()
+        return table.filter(pc.equal(table["tenant_id"], tenant_id))
+    
     def add_tenant_identifier(self, record: Dict[str, Any], 
                              tenant_id: str) -> Dict[str, Any]:
         """Add tenant identifier to record"""
@@ -288,8 +344,10 @@ class TenantDataIsolation:
         return record
     
     @staticmethod
+    @lru_cache(maxsize=65536)
     def _compute_hash(tenant_id: str, record_id: str) -> str:
         """Compute hash for data integrity verification"""
+        # PERFORMANCE: Memoized; re-tagging the same records skips the SHA-256
         content = f"{tenant_id}:{record_id}".encode()
         return hashlib.sha256(content).hexdigest()[:16]
     
@@ -3,14 +3,40 @@ RBAC (Role-Based Access Control) System
 Manages user roles, permissions, and access control
 """
 
+import functools
 import logging
-from typing import Dict, List, Any, Optional, Set
+import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, FrozenSet, Iterator, List, Any, Optional, Set, Tuple
 from enum import Enum
 from datetime import datetime, timezone
 import hashlib
 
+# Optional numpy for vectorized cohort queries
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
+# Per-request memo of decorator permission checks; None outside a request scope
+_rbac_check_cache: ContextVar[Optional[Dict[Tuple, bool]]] = ContextVar(
+    "rbac_check_cache", default=None
+)
+
+
+@contextmanager
+def permission_check_scope() -> Iterator[None]:
+    """Cache AccessControl permission checks for the duration of a request"""
+    token = _rbac_check_cache.set({})
+    try:
+        yield
+    finally:
+        _rbac_check_cache.reset(token)
+
 
 class Role(str, Enum):
     """User roles"""
@@ -53,32 +79,71 @@ class Permission(str, Enum):
     SYSTEM_ADMIN = "system:admin"
 
 
-# Role -> Permissions mapping
-ROLE_PERMISSIONS = {
-    Role.ADMIN: set(Permission),  # All permissions
-    Role.MANAGER: {
+# Role -> Permissions mapping (frozen so they can be shared and cached safely)
+ROLE_PERMISSIONS: Dict[Role, FrozenSet[Permission]] = {
+    Role.ADMIN: frozenset(Permission),  # All permissions
+    Role.MANAGER: frozenset({
         Permission.LEAD_CREATE, Permission.LEAD_READ, Permission.LEAD_UPDATE,
         Permission.LEAD_EXPORT, Permission.WORKFLOW_READ, Permission.WORKFLOW_EXECUTE,
         Permission.ANALYTICS_READ, Permission.USER_READ, Permission.CRM_SYNC
-    },
-    Role.SALESPERSON: {
+    }),
+    Role.SALESPERSON: frozenset({
         Permission.LEAD_CREATE, Permission.LEAD_READ, Permission.LEAD_UPDATE,
         Permission.LEAD_EXPORT, Permission.WORKFLOW_READ
-    },
-    Role.ANALYST: {
+    }),
+    Role.ANALYST: frozenset({
         Permission.LEAD_READ, Permission.ANALYTICS_READ, Permission.ANALYTICS_EXPORT
-    },
-    Role.GUEST: {
+    }),
+    Role.GUEST: frozenset({
         Permission.LEAD_READ, Permission.ANALYTICS_READ
-    }
+    })
+}
+
+# Bit assigned to each permission; keys also match plain permission strings
+PERMISSION_BITS: Dict[Permission, int] = {p: 1 << i for i, p in enumerate(Permission)}
+
+
+def _mask_of(permissions) -> int:
+    """OR together the bits of known permissions (unknown ones contribute 0)"""
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS.get(permission, 0)
+    return mask
+
+
+ROLE_MASKS: Dict[Role, int] = {role: _mask_of(perms) for role, perms in ROLE_PERMISSIONS.items()}
+
+# Serialized permission values per role, shared by every User.to_dict()
+ROLE_PERMISSION_VALUES: Dict[Role, Tuple[str, ...]] = {
+    role: tuple(sorted(p.value for p in perms)) for role, perms in ROLE_PERMISSIONS.items()
 }
 
 
 class User:
-    """User with role and permissions"""
+    """
+    User with role and permissions
+    
+    Changes to role and active, and to custom_permissions once followed by
+    invalidate_permissions(), are reported to the owning RBACManager so its
+    role index and mask table stay current.
+    """
+    
+    # PERFORMANCE: Slots avoid a per-user __dict__ in large user tables
+    __slots__ = (
+        '_perm_cache', '_mask_cache', '_perm_values_cache', 'perm_version',
+        '_owner', 'user_id', 'username', '_role', 'email', '_active',
+        'created_at', 'last_login', 'custom_permissions'
+    )
     
     def __init__(self, user_id: str, username: str, role: Role, 
                  email: str = "", active: bool = True):
+        self._perm_cache: Optional[FrozenSet[Permission]] = None
+        self._mask_cache: Optional[int] = None
+        self._perm_values_cache: Optional[Tuple[str, ...]] = None
+        # Bumped whenever effective permissions change; part of check cache keys
+        self.perm_version = 0
+        # RBACManager holding this user, set when it is registered
+        self._owner: Optional["RBACManager"] = None
         self.user_id = user_id
         self.username = username
         self.role = role
@@ -88,10 +153,64 @@ class User:
         self.last_login = None
         self.custom_permissions: Set[Permission] = set()
     
-    def get_permissions(self) -> Set[Permission]:
+    @property
+    def role(self) -> Role:
+        return self._role
+    
+    @role.setter
+    def role(self, value: Role) -> None:
+        previous = getattr(self, '_role', None)
+        self._role = value
+        self._clear_permission_caches()
+        self._notify_owner(previous)
+    
+    @property
+    def active(self) -> bool:
+        return self._active
+    
+    @active.setter
+    def active(self, value: bool) -> None:
+        self._active = value
+        self._notify_owner(self._role)
+    
+    def invalidate_permissions(self) -> None:
+        """Drop cached permissions after custom_permissions changes"""
+        self._clear_permission_caches()
+        self._notify_owner(self._role)
+    
+    def _clear_permission_caches(self) -> None:
+        self._perm_cache = None
+        self._mask_cache = None
+        self._perm_values_cache = None
+        self.perm_version += 1
+    
+    def _notify_owner(self, previous_role: Optional[Role]) -> None:
+        if self._owner is not None:
+            self._owner._on_user_changed(self, previous_role)
+    
+    def _get_mask(self) -> int:
+        if self._mask_cache is None:
+            self._mask_cache = ROLE_MASKS.get(self.role, 0) | _mask_of(self.custom_permissions)
+        return self._mask_cache
+    
+    def get_permissions(self) -> FrozenSet[Permission]:
         """Get all permissions for user"""
-        base_permissions = ROLE_PERMISSIONS.get(self.role, set()).copy()
-        return base_permissions | self.custom_permissions
+        # PERFORMANCE: Computed once until the role or custom permissions change
+        if self._perm_cache is None:
+            base = ROLE_PERMISSIONS.get(self.role, frozenset())
+            # Role-only users share the immutable role set; no union is built
+            self._perm_cache = base | self.custom_permissions if self.custom_permissions else base
+        return self._perm_cache
+    
+    def get_permission_values(self) -> Tuple[str, ...]:
+        """Get sorted permission values for serialization"""
+        # PERFORMANCE: Role-only users share the precomputed per-role tuple
+        if self._perm_values_cache is None:
+            if self.custom_permissions:
+                self._perm_values_cache = tuple(sorted(p.value for p in self.get_permissions()))
+            else:
+                self._perm_values_cache = ROLE_PERMISSION_VALUES.get(self.role, ())
+        return self._perm_values_cache
     
     def has_permission(self, permission: Permission) -> bool:
         """Check if user has specific permission"""
@@ -101,15 +220,33 @@ class User:
         if self.role == Role.ADMIN:
             return True
         
-        return permission in self.get_permissions()
+        # PERFORMANCE: One integer AND against the cached permission bitmask
+        return bool(self._get_mask() & PERMISSION_BITS.get(permission, 0))
     
     def has_any_permission(self, permissions: List[Permission]) -> bool:
         """Check if user has any of the permissions"""
-        return any(self.has_permission(p) for p in permissions)
+        if not self.active:
+            return False
+        if self.role == Role.ADMIN:
+            return bool(permissions)
+        return bool(self._get_mask() & _mask_of(permissions))
     
     def has_all_permissions(self, permissions: List[Permission]) -> bool:
         """Check if user has all permissions"""
-        return all(self.has_permission(p) for p in permissions)
+        if not permissions:
+            return True
+        if not self.active:
+            return False
+        if self.role == Role.ADMIN:
+            return True
+        
+        required = 0
+        for permission in permissions:
+            bit = PERMISSION_BITS.get(permission)
+            if bit is None:
+                return False
+            required |= bit
+        return self._get_mask() & required == required
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -121,17 +258,84 @@ class User:
             "active": self.active,
             "created_at": self.created_at,
             "last_login": self.last_login,
-            "permissions": [p.value for p in self.get_permissions()]
+            "permissions": list(self.get_permission_values())
         }
 
 
+class _UserMaskTable:
+    """
+    Struct-of-arrays mirror of every user's effective permission mask and
+    active flag, so cohort queries are one vectorized AND over all users.
+    Rows are append-only; users are never removed from RBACManager.
+    """
+    
+    # Admins implicitly hold every permission
+    ADMIN_MASK = (1 << 64) - 1
+    
+    def __init__(self, capacity: int = 1024):
+        self.user_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self.masks = np.zeros(capacity, dtype=np.uint64)
+        self.active = np.zeros(capacity, dtype=bool)
+    
+    def sync(self, user: "User") -> None:
+        """Insert or refresh the row for a user"""
+        row = self._rows.get(user.user_id)
+        if row is None:
+            row = len(self.user_ids)
+            if row == len(self.masks):
+                self.masks = np.concatenate([self.masks, np.zeros_like(self.masks)])
+                self.active = np.concatenate([self.active, np.zeros_like(self.active)])
+            self._rows[user.user_id] = row
+            self.user_ids.append(user.user_id)
+        self.masks[row] = self.ADMIN_MASK if user.role == Role.ADMIN else user._get_mask()
+        self.active[row] = user.active
+    
+    def select(self, bit: int) -> List[str]:
+        """IDs of active users whose mask contains the bit, in creation order"""
+        n = len(self.user_ids)
+        hits = np.flatnonzero((self.masks[:n] & np.uint64(bit)).astype(bool) & self.active[:n])
+        user_ids = self.user_ids
+        return [user_ids[i] for i in hits]
+    
+    def check(self, user_ids: List[str], bit: int) -> List[bool]:
+        """Per-user result of testing the bit; unknown IDs are denied"""
+        rows = self._rows
+        idx = np.fromiter((rows.get(uid, -1) for uid in user_ids), dtype=np.intp, count=len(user_ids))
+        known = idx >= 0
+        idx[~known] = 0
+        allowed = (self.masks[idx] & np.uint64(bit)).astype(bool) & self.active[idx] & known
+        return allowed.tolist()
+
+
 class RBACManager:
     """Manage users, roles, and permissions"""
     
     def __init__(self):
         self.users: Dict[str, User] = {}
+        # Secondary indexes so lookups don't scan every user
+        self._username_index: Dict[str, str] = {}  # username -> user_id
+        self._role_index: Dict[Role, Dict[str, User]] = {role: {} for role in Role}
+        # Creation position of each user, to keep role lists in that order
+        self._creation_order: Dict[str, int] = {}
+        # Roles whose index gained a user out of creation order
+        self._unordered_roles: Set[Role] = set()
+        self._mask_table = _UserMaskTable() if HAS_NUMPY else None
         self.logger = logging.getLogger(__name__)
     
+    def _sync_user(self, user: User) -> None:
+        """Refresh a user's row in the mask table after a permission-relevant change"""
+        if self._mask_table is not None:
+            self._mask_table.sync(user)
+    
+    def _on_user_changed(self, user: User, previous_role: Optional[Role]) -> None:
+        """Keep the role index and mask table in step with a user's attributes"""
+        if user.role != previous_role:
+            self._role_index.get(previous_role, {}).pop(user.user_id, None)
+            self._role_index.setdefault(user.role, {})[user.user_id] = user
+            self._unordered_roles.add(user.role)
+        self._sync_user(user)
+    
     def create_user(self, user_id: str, username: str, role: Role, 
                    email: str = "") -> User:
         """Create a new user"""
@@ -140,6 +344,12 @@ class RBACManager:
         
         user = User(user_id, username, role, email)
         self.users[user_id] = user
+        # First user with a given username wins, as with the former linear scan
+        self._username_index.setdefault(username, user_id)
+        self._role_index.setdefault(role, {})[user_id] = user
+        self._creation_order[user_id] = len(self._creation_order)
+        self._sync_user(user)
+        user._owner = self
         
         self.logger.info(f"Created user {username} with role {role.value}")
         return user
@@ -150,10 +360,8 @@ class RBACManager:
     
     def get_user_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        for user in self.users.values():
-            if user.username == username:
-                return user
-        return None
+        user_id = self._username_index.get(username)
+        return self.users.get(user_id) if user_id is not None else None
     
     def update_user_role(self, user_id: str, role: Role) -> bool:
         """Update user role"""
@@ -192,6 +400,7 @@ class RBACManager:
             return False
         
         user.custom_permissions.add(permission)
+        user.invalidate_permissions()
         self.logger.info(f"Granted {permission.value} to {user_id}")
         return True
     
@@ -202,25 +411,66 @@ class RBACManager:
             return False
         
         user.custom_permissions.discard(permission)
+        user.invalidate_permissions()
         self.logger.info(f"Revoked {permission.value} from {user_id}")
         return True
     
+    def iter_users(self, active_only: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield user dicts one at a time without building an intermediate list"""
+        for user in self.users.values():
+            if active_only and not user.active:
+                continue
+            yield user.to_dict()
+    
     def list_users(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """List all users"""
-        users = self.users.values()
-        
-        if active_only:
-            users = [u for u in users if u.active]
-        
-        return [u.to_dict() for u in users]
+        return list(self.iter_users(active_only))
     
     def get_users_with_permission(self, permission: Permission) -> List[User]:
         """Get all users with specific permission"""
-        return [u for u in self.users.values() if u.has_permission(permission)]
+        # PERFORMANCE: Resolve the permission bit once, then test each user's
+        # cached mask; denials cost one AND, so there is nothing to cache
+        bit = PERMISSION_BITS.get(permission, 0)
+        if self._mask_table is not None and bit:
+            # PERFORMANCE: One vectorized AND across all users' masks
+            users = self.users
+            return [users[user_id] for user_id in self._mask_table.select(bit)]
+        return [
+            u for u in self.users.values()
+            if u.active and (u.role == Role.ADMIN or u._get_mask() & bit)
+        ]
+    
+    def batch_authorize(self, user_ids: List[str], permission: Permission) -> List[bool]:
+        """
+        Check one permission for many users at once
+        
+        Args:
+            user_ids: IDs of users to check; unknown IDs are denied
+            permission: Permission every user is checked against
+        
+        Returns:
+            One result per user ID, in the same order
+        """
+        bit = PERMISSION_BITS.get(permission, 0)
+        if self._mask_table is not None and bit:
+            # PERFORMANCE: Gather all masks and AND them in a single numpy pass
+            return self._mask_table.check(user_ids, bit)
+        users = self.users
+        return [
+            user is not None and user.has_permission(permission)
+            for user in map(users.get, user_ids)
+        ]
     
     def get_users_with_role(self, role: Role) -> List[User]:
-        """Get all users with specific role"""
-        return [u for u in self.users.values() if u.role == role]
+        """Get all users with specific role, in creation order"""
+        members = self._role_index.get(role, {})
+        if role in self._unordered_roles:
+            # A user changed into this role since the last call
+            order = self._creation_order
+            members = dict(sorted(members.items(), key=lambda item: order[item[0]]))
+            self._role_index[role] = members
+            self._unordered_roles.discard(role)
+        return list(members.values())
 
 
 class AccessControl:
@@ -230,6 +480,18 @@ class AccessControl:
         self.rbac = rbac_manager
         self.logger = logging.getLogger(__name__)
     
+    @staticmethod
+    def _cached_check(user: User, key: Any, check: Callable[[], bool]) -> bool:
+        """Run a permission check, reusing its result within the current request"""
+        cache = _rbac_check_cache.get()
+        if cache is None:
+            return check()
+        cache_key = (user.user_id, user.perm_version, user.active, key)
+        allowed = cache.get(cache_key)
+        if allowed is None:
+            allowed = cache[cache_key] = check()
+        return allowed
+    
     def require_role(self, required_role: Role):
         """Decorator to require specific role"""
         def decorator(func):
@@ -255,31 +517,22 @@ class AccessControl:
     def require_permission(self, required_permission: Permission):
         """Decorator to require specific permission"""
         def decorator(func):
-            def wrapper(*args, current_user: Optional[User] = None, **kwargs):
-                if not current_user:
-                    raise PermissionError("User not authenticated")
-                
-                if not current_user.has_permission(required_permission):
-                    self.logger.warning(
-                        f"Access denied: {current_user.username} "
-                        f"lacks {required_permission.value}"
-                    )
-                    raise PermissionError(
-                        f"Requires {required_permission.value} permission"
-                    )
-                
-                return func(*args, current_user=current_user, **kwargs)
-            return wrapper
+            return _PermissionGuard(func, required_permission, self.logger)
         return decorator
     
     def require_any_permission(self, permissions: List[Permission]):
         """Decorator to require any of the permissions"""
+        check_key = frozenset(permissions)
+        
         def decorator(func):
             def wrapper(*args, current_user: Optional[User] = None, **kwargs):
                 if not current_user:
                     raise PermissionError("User not authenticated")
                 
-                if not current_user.has_any_permission(permissions):
+                if not self._cached_check(
+                    current_user, check_key,
+                    lambda: current_user.has_any_permission(permissions)
+                ):
                     perms = [p.value for p in permissions]
                     self.logger.warning(
                         f"Access denied: {current_user.username} "
@@ -290,3 +543,40 @@ class AccessControl:
                 return func(*args, current_user=current_user, **kwargs)
             return wrapper
         return decorator
+
+
+class _PermissionGuard:
+    """
+    Wrapper installed by AccessControl.require_permission. Holds its
+    configuration in slots rather than closure cells, and binds like a
+    function when it decorates a method.
+    """
+    
+    # __dict__ carries the metadata copied by functools.update_wrapper
+    __slots__ = ("func", "permission", "logger", "__dict__")
+    
+    def __init__(self, func: Callable, permission: Permission, logger: logging.Logger):
+        self.func = func
+        self.permission = permission
+        self.logger = logger
+        functools.update_wrapper(self, func)
+    
+    def __get__(self, obj, objtype=None):
+        return self if obj is None else types.MethodType(self, obj)
+    
+    def __call__(self, *args, current_user: Optional[User] = None, **kwargs):
+        if not current_user:
+            raise PermissionError("User not authenticated")
+        
+        permission = self.permission
+        if not AccessControl._cached_check(
+            current_user, permission,
+            lambda: current_user.has_permission(permission)
+        ):
+            self.logger.warning(
+                f"Access denied: {current_user.username} "
+                f"lacks {permission.value}"
+            )
+            raise PermissionError(f"Requires {permission.value} permission")
+        
+        return self.func(*args, current_user=current_user, **kwargs)
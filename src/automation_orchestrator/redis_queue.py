@@ -3,13 +3,25 @@ Redis-based background task queue for Automation Orchestrator
 Replaces in-process background tasks with distributed Redis queue
 """
 
+import asyncio
+import functools
 import json
 import logging
-from typing import Dict, Any, Callable, Optional
+import time
+import uuid
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import redis
+import redis.asyncio
 from enum import Enum
 
+# Optional fast JSON for task payloads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Optional fake redis for local development/testing
 try:
     import fakeredis
@@ -19,6 +31,78 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+if HAS_ORJSON:
+    # PERFORMANCE: orjson is C-accelerated; its output stays plain JSON text so
+    # existing task hashes and decode_responses clients remain compatible
+    def _dumps_task_data(task_data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(task_data, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads_task_data = orjson.loads
+else:
+    _dumps_task_data = json.dumps
+    _loads_task_data = json.loads
+
+
+def _new_task_obj(task_id: str,
+                  task_type: str,
+                  task_data: Dict[str, Any],
+                  queue_name: str,
+                  retry_count: int) -> Dict[str, Any]:
+    """Build the metadata hash stored for a newly enqueued task"""
+    return {
+        "id": task_id,
+        "type": task_type,
+        "data": _dumps_task_data(task_data),
+        "queue_name": queue_name,
+        "status": TaskStatus.PENDING.value,
+        "created_at": datetime.now().isoformat(),
+        "retry_count": retry_count,
+        "retries_remaining": retry_count,
+        "error": ""
+    }
+
+
+# PERFORMANCE: Pop a task ID and mark its metadata processing server-side,
+# atomically and in a single round-trip
+_DEQUEUE_SCRIPT = """
+local tid = redis.call('LPOP', KEYS[1])
+if not tid then return nil end
+local tk = KEYS[2] .. tid
+if redis.call('EXISTS', tk) == 0 then return {tid} end
+redis.call('HSET', tk, 'status', ARGV[1])
+return {tid, redis.call('HGETALL', tk)}
+"""
+
+# Seconds before the first retry; each further retry doubles the delay
+RETRY_BASE_DELAY = 2.0
+
+# Record a failure and, if retries remain, schedule the task on the queue's
+# retry ZSET scored by when it becomes due - one atomic step, no instant re-push
+_FAIL_SCRIPT = """
+local tk = KEYS[1]
+local remaining = tonumber(redis.call('HGET', tk, 'retries_remaining') or '0') or 0
+if ARGV[2] == '1' and remaining > 0 then
+    remaining = remaining - 1
+    local attempt = (tonumber(redis.call('HGET', tk, 'retry_count') or '0') or 0) - remaining
+    if attempt < 1 then attempt = 1 end
+    local queue = redis.call('HGET', tk, 'queue_name') or 'default'
+    redis.call('HSET', tk, 'status', ARGV[6], 'error', ARGV[1], 'retries_remaining', remaining)
+    redis.call('ZADD', KEYS[2] .. queue, tonumber(ARGV[4]) + tonumber(ARGV[5]) * 2 ^ (attempt - 1), ARGV[3])
+    return {1, remaining}
+end
+redis.call('HSET', tk, 'status', ARGV[7], 'error', ARGV[1], 'retries_remaining', remaining)
+return {0, remaining}
+"""
+
+# Move retries that are due from the retry ZSET back onto the work queue
+_PROMOTE_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+if #ids == 0 then return 0 end
+redis.call('ZREM', KEYS[1], unpack(ids))
+redis.call('RPUSH', KEYS[2], unpack(ids))
+return #ids
+"""
+
 
 class TaskStatus(Enum):
     """Task status enumeration"""
@@ -46,7 +130,9 @@ class RedisQueue:
                  queue_prefix: str = "ao:tasks",
                  use_fake_redis: bool = False,
                  allow_fallback: bool = True,
-                 required: bool = False):
+                 required: bool = False,
+                 max_connections: int = 64,
+                 pool_timeout: int = 20):
         """
         Initialize Redis queue
         
@@ -55,43 +141,84 @@ class RedisQueue:
             redis_port: Redis server port
             redis_db: Redis database number
             queue_prefix: Prefix for all queue keys
+            max_connections: Upper bound on pooled Redis connections
+            pool_timeout: Seconds to wait for a free pooled connection
         """
         self.redis_host = redis_host
         self.redis_port = redis_port
         self.redis_db = redis_db
         self.queue_prefix = queue_prefix
+        self._queues_key = f"{queue_prefix}:__queues__"
+        self.pool: Optional[redis.ConnectionPool] = None
+        self._pool_kwargs: Dict[str, Any] = {}
+        self._fake_server = None
 
         try:
             if use_fake_redis:
                 if not HAS_FAKEREDIS:
                     raise RuntimeError("fakeredis not installed")
-                self.client = fakeredis.FakeStrictRedis(decode_responses=True)
+                self._fake_server = fakeredis.FakeServer()
+                self.client = fakeredis.FakeStrictRedis(server=self._fake_server, decode_responses=True)
                 self.client.ping()
                 logger.info("Connected to fakeredis (in-memory queue)")
             else:
-                self.client = redis.Redis(
+                # PERFORMANCE: Bounded, blocking pool so bursts reuse TCP
+                # connections instead of opening one per caller
+                self._pool_kwargs = dict(
                     host=redis_host,
                     port=redis_port,
                     db=redis_db,
+                    max_connections=max_connections,
+                    timeout=pool_timeout,
                     decode_responses=True,
                     socket_connect_timeout=5,
                     socket_keepalive=True,
                     health_check_interval=30
                 )
+                self.pool = redis.BlockingConnectionPool(**self._pool_kwargs)
+                self.client = redis.Redis(connection_pool=self.pool)
                 self.client.ping()
                 logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
         except Exception as e:
+            if self.pool is not None:
+                self.pool.disconnect()
+                self.pool = None
             if required:
                 raise RuntimeError(f"Redis connection required but failed: {e}")
             if allow_fallback and HAS_FAKEREDIS:
                 logger.warning(f"Redis unavailable, using fakeredis fallback: {e}")
-                self.client = fakeredis.FakeStrictRedis(decode_responses=True)
+                self._fake_server = fakeredis.FakeServer()
+                self.client = fakeredis.FakeStrictRedis(server=self._fake_server, decode_responses=True)
                 self.client.ping()
             elif allow_fallback:
                 logger.warning(f"Redis unavailable, falling back to in-memory queue: {e}")
                 self.client = None
             else:
                 raise RuntimeError(f"Redis connection failed: {e}")
+
+        self._dequeue_sha = self._load_script(_DEQUEUE_SCRIPT)
+        self._fail_sha = self._load_script(_FAIL_SCRIPT)
+        self._promote_sha = self._load_script(_PROMOTE_SCRIPT)
+
+    def _load_script(self, script: str) -> Optional[str]:
+        """Register a Lua script, or None if scripting is unavailable"""
+        if not self.client:
+            return None
+        try:
+            return self.client.script_load(script)
+        except Exception as e:
+            logger.debug(f"Lua scripting unavailable, using pipelined commands: {e}")
+            return None
+
+    def _run_script(self, sha_attr: str, script: str, keys: tuple, args: tuple) -> Any:
+        """Run a registered script by SHA, re-registering it if Redis lost it"""
+        try:
+            return self.client.evalsha(getattr(self, sha_attr), len(keys), *keys, *args)
+        except redis.exceptions.NoScriptError:
+            # Script cache was flushed (e.g. server restart); run it inline and re-register
+            result = self.client.eval(script, len(keys), *keys, *args)
+            setattr(self, sha_attr, self._load_script(script))
+            return result
     
     def _get_queue_key(self, queue_name: str) -> str:
         """Get full queue key"""
@@ -101,6 +228,10 @@ class RedisQueue:
         """Get full task metadata key"""
         return f"{self.queue_prefix}:task:{task_id}"
 
+    def _get_retry_key(self, queue_name: str) -> str:
+        """Get the delayed-retry ZSET key for a queue"""
+        return f"{self.queue_prefix}:retry:{queue_name}"
+
     def ping(self) -> bool:
         """Check Redis connectivity."""
         if not self.client:
@@ -110,6 +241,13 @@ class RedisQueue:
         except Exception:
             return False
 
+    def close(self) -> None:
+        """Close the client and release all pooled connections."""
+        if self.client:
+            self.client.close()
+        if self.pool is not None:
+            self.pool.disconnect()
+
     def get_queue_depth(self, queue_name: str = "default") -> int:
         """Return the current queue length."""
         if not self.client:
@@ -138,8 +276,8 @@ class RedisQueue:
         Returns:
             Task ID for tracking
         """
-        import uuid
-        task_id = str(uuid.uuid4())
+        # PERFORMANCE: Undashed hex keeps task keys short on the wire and in Redis
+        task_id = uuid.uuid4().hex
         
         if not self.client:
             logger.debug(f"Redis unavailable, storing task in memory: {task_id}")
@@ -149,24 +287,15 @@ class RedisQueue:
             queue_key = self._get_queue_key(queue_name)
             task_key = self._get_task_key(task_id)
             
-            # Create task object
-            task_obj = {
-                "id": task_id,
-                "type": task_type,
-                "data": json.dumps(task_data),
-                "status": TaskStatus.PENDING.value,
-                "created_at": datetime.now().isoformat(),
-                "retry_count": retry_count,
-                "retries_remaining": retry_count,
-                "error": None
-            }
+            task_obj = _new_task_obj(task_id, task_type, task_data, queue_name, retry_count)
             
-            # Store task metadata
-            self.client.hset(task_key, mapping=task_obj)
-            self.client.expire(task_key, ttl_seconds)
-            
-            # Add to queue
-            self.client.rpush(queue_key, task_id)
+            # PERFORMANCE: Store metadata and queue the ID in one round-trip
+            with self.client.pipeline(transaction=False) as pipe:
+                pipe.hset(task_key, mapping=task_obj)
+                pipe.expire(task_key, ttl_seconds)
+                pipe.rpush(queue_key, task_id)
+                pipe.sadd(self._queues_key, queue_name)
+                pipe.execute()
             
             logger.info(f"Enqueued task {task_id}: {task_type}")
             return task_id
@@ -192,6 +321,9 @@ class RedisQueue:
         try:
             queue_key = self._get_queue_key(queue_name)
             
+            if timeout == 0 and self._dequeue_sha:
+                return self._dequeue_atomic(queue_key)
+            
             # Get task ID from queue
             if timeout == 0:
                 task_id = self.client.lpop(queue_key)
@@ -203,20 +335,23 @@ class RedisQueue:
             if not task_id:
                 return None
             
-            # Get task metadata
+            # PERFORMANCE: Fetch metadata and mark processing in one round-trip
             task_key = self._get_task_key(task_id)
-            task_data = self.client.hgetall(task_key)
+            with self.client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(task_key)
+                pipe.hset(task_key, mapping={"status": TaskStatus.PROCESSING.value})
+                task_data = pipe.execute()[0]
             
             if not task_data:
+                # The status write created a stray hash for a missing task
+                self.client.delete(task_key)
                 logger.warning(f"Task metadata not found for {task_id}")
                 return None
             
-            # Update status to processing
             task_data["status"] = TaskStatus.PROCESSING.value
-            self.client.hset(task_key, mapping={"status": TaskStatus.PROCESSING.value})
             
             # Parse JSON data
-            task_data["data"] = json.loads(task_data.get("data", "{}"))
+            task_data["data"] = _loads_task_data(task_data.get("data", "{}"))
             
             logger.info(f"Dequeued task {task_id}: {task_data.get('type')}")
             return task_data
@@ -225,6 +360,29 @@ class RedisQueue:
             logger.error(f"Error dequeuing task: {e}")
             return None
     
+    def _dequeue_atomic(self, queue_key: str) -> Optional[Dict[str, Any]]:
+        """Pop and claim a task with the registered Lua script"""
+        result = self._run_script(
+            "_dequeue_sha", _DEQUEUE_SCRIPT,
+            (queue_key, f"{self.queue_prefix}:task:"),
+            (TaskStatus.PROCESSING.value,)
+        )
+        
+        if not result:
+            return None
+        
+        task_id = result[0]
+        if len(result) < 2:
+            logger.warning(f"Task metadata not found for {task_id}")
+            return None
+        
+        flat = result[1]
+        task_data = dict(zip(flat[::2], flat[1::2]))
+        task_data["data"] = _loads_task_data(task_data.get("data", "{}"))
+        
+        logger.info(f"Dequeued task {task_id}: {task_data.get('type')}")
+        return task_data
+    
     def mark_complete(self, task_id: str) -> bool:
         """
         Mark task as completed
@@ -264,33 +422,99 @@ class RedisQueue:
         
         try:
             task_key = self._get_task_key(task_id)
-            task_data = self.client.hgetall(task_key)
+            now = time.time()
             
-            retries_remaining = int(task_data.get("retries_remaining", 0))
+            if self._fail_sha:
+                retried, retries_remaining = self._run_script(
+                    "_fail_sha", _FAIL_SCRIPT,
+                    (task_key, f"{self.queue_prefix}:retry:"),
+                    (error, "1" if retry else "0", task_id, now, RETRY_BASE_DELAY,
+                     TaskStatus.RETRY.value, TaskStatus.FAILED.value)
+                )
+            else:
+                retried, retries_remaining = self._mark_failed_pipelined(
+                    task_key, task_id, error, retry, now
+                )
             
-            if retry and retries_remaining > 0:
-                # Re-queue for retry
-                new_status = TaskStatus.RETRY.value
-                retries_remaining -= 1
-                queue_name = task_data.get("queue_name", "default")
-                queue_key = self._get_queue_key(queue_name)
-                self.client.rpush(queue_key, task_id)
+            if retried:
+                # Scheduled with backoff; promote_due_retries re-queues it when due
                 logger.info(f"Task {task_id} marked for retry ({retries_remaining} retries left)")
             else:
-                new_status = TaskStatus.FAILED.value
                 logger.error(f"Task {task_id} failed permanently: {error}")
             
-            # Update task
-            self.client.hset(task_key, mapping={
-                "status": new_status,
+            return True
+        except Exception as e:
+            logger.error(f"Error marking task failed: {e}")
+            return False
+    
+    def _mark_failed_pipelined(self,
+                               task_key: str,
+                               task_id: str,
+                               error: str,
+                               retry: bool,
+                               now: float) -> Tuple[bool, int]:
+        """mark_failed for servers without Lua: read, then one MULTI/EXEC write"""
+        task_data = self.client.hgetall(task_key)
+        retries_remaining = int(task_data.get("retries_remaining", 0))
+        retried = retry and retries_remaining > 0
+        
+        with self.client.pipeline(transaction=True) as pipe:
+            if retried:
+                retries_remaining -= 1
+                attempt = max(int(task_data.get("retry_count", 0)) - retries_remaining, 1)
+                queue_name = task_data.get("queue_name", "default")
+                pipe.zadd(
+                    self._get_retry_key(queue_name),
+                    {task_id: now + RETRY_BASE_DELAY * 2 ** (attempt - 1)}
+                )
+            pipe.hset(task_key, mapping={
+                "status": TaskStatus.RETRY.value if retried else TaskStatus.FAILED.value,
                 "error": error,
                 "retries_remaining": retries_remaining
             })
+            pipe.execute()
+        
+        return retried, retries_remaining
+    
+    def promote_due_retries(self,
+                            queue_name: str = "default",
+                            now: Optional[float] = None,
+                            limit: int = 100) -> int:
+        """
+        Move retries whose backoff has elapsed back onto the work queue
+        
+        Args:
+            queue_name: Queue whose retry schedule to drain
+            now: Current epoch time (defaults to time.time())
+            limit: Maximum number of tasks to move per call
+        
+        Returns:
+            Number of tasks re-queued
+        """
+        if not self.client:
+            return 0
+        
+        if now is None:
+            now = time.time()
+        retry_key = self._get_retry_key(queue_name)
+        queue_key = self._get_queue_key(queue_name)
+        
+        try:
+            if self._promote_sha:
+                return int(self._run_script(
+                    "_promote_sha", _PROMOTE_SCRIPT, (retry_key, queue_key), (now, limit)
+                ))
             
-            return True
+            moved = 0
+            for task_id in self.client.zrangebyscore(retry_key, "-inf", now, start=0, num=limit):
+                # ZREM succeeds for exactly one caller, so concurrent workers never double-queue
+                if self.client.zrem(retry_key, task_id):
+                    self.client.rpush(queue_key, task_id)
+                    moved += 1
+            return moved
         except Exception as e:
-            logger.error(f"Error marking task failed: {e}")
-            return False
+            logger.error(f"Error promoting due retries: {e}")
+            return 0
     
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -310,7 +534,7 @@ class RedisQueue:
             task_data = self.client.hgetall(task_key)
             
             if task_data:
-                task_data["data"] = json.loads(task_data.get("data", "{}"))
+                task_data["data"] = _loads_task_data(task_data.get("data", "{}"))
             
             return task_data
         except Exception as e:
@@ -323,25 +547,133 @@ class RedisQueue:
             return {}
         
         try:
-            stats = {}
-            pattern = f"{self.queue_prefix}:*"
-            keys = self.client.keys(pattern)
+            # PERFORMANCE: Read known queue names from the registry set instead
+            # of a blocking KEYS scan over the whole keyspace
+            names = list(self.client.smembers(self._queues_key))
+            if not names:
+                names = self._discover_queues()
             
-            for key in keys:
-                if key.startswith(f"{self.queue_prefix}:"):
-                    queue_name = key.replace(f"{self.queue_prefix}:", "", 1)
-                    queue_length = self.client.llen(key)
-                    if queue_length > 0:
-                        stats[queue_name] = queue_length
+            with self.client.pipeline(transaction=False) as pipe:
+                for name in names:
+                    pipe.llen(self._get_queue_key(name))
+                lengths = pipe.execute()
             
-            return stats
+            return {name: length for name, length in zip(names, lengths) if length > 0}
         except Exception as e:
             logger.error(f"Error getting queue stats: {e}")
             return {}
 
+    
+    def _discover_queues(self) -> List[str]:
+        """Find queues created before the registry existed and register them"""
+        prefix = f"{self.queue_prefix}:"
+        names = [
+            key[len(prefix):]
+            for key in self.client.scan_iter(match=f"{prefix}*", count=500, _type="list")
+        ]
+        if names:
+            self.client.sadd(self._queues_key, *names)
+        return names
+
+
+class AsyncRedisQueue:
+    """
+    Asyncio counterpart of RedisQueue for enqueueing from request handlers.
+    Shares the keyspace and task format of a RedisQueue, so sync workers
+    consume what async producers enqueue without blocking the event loop.
+    """
+    
+    def __init__(self, queue: RedisQueue):
+        """
+        Initialize async queue from a connected RedisQueue
+        
+        Args:
+            queue: Sync queue whose connection outcome (Redis pool,
+                fakeredis fallback or in-memory) this queue mirrors
+        """
+        self.queue_prefix = queue.queue_prefix
+        self._queues_key = queue._queues_key
+        self.pool: Optional[redis.asyncio.ConnectionPool] = None
+        
+        if queue.pool is not None:
+            self.pool = redis.asyncio.BlockingConnectionPool(**queue._pool_kwargs)
+            self.client = redis.asyncio.Redis(connection_pool=self.pool)
+        elif queue._fake_server is not None:
+            self.client = fakeredis.FakeAsyncRedis(server=queue._fake_server, decode_responses=True)
+        else:
+            self.client = None
+    
+    def _get_queue_key(self, queue_name: str) -> str:
+        """Get full queue key"""
+        return f"{self.queue_prefix}:{queue_name}"
+    
+    def _get_task_key(self, task_id: str) -> str:
+        """Get full task metadata key"""
+        return f"{self.queue_prefix}:task:{task_id}"
+    
+    async def ping(self) -> bool:
+        """Check Redis connectivity."""
+        if not self.client:
+            return False
+        try:
+            return bool(await self.client.ping())
+        except Exception:
+            return False
+    
+    async def close(self) -> None:
+        """Close the client and release all pooled connections."""
+        if self.client:
+            await self.client.aclose()
+        if self.pool is not None:
+            await self.pool.disconnect()
+    
+    async def enqueue(self,
+                      task_type: str,
+                      task_data: Dict[str, Any],
+                      queue_name: str = "default",
+                      retry_count: int = 3,
+                      ttl_seconds: int = 3600) -> str:
+        """
+        Enqueue a task to Redis queue without blocking the event loop
+        
+        Args:
+            task_type: Type of task (e.g., "crm_update", "email_send")
+            task_data: Task data payload
+            queue_name: Name of queue to use
+            retry_count: Number of retries on failure
+            ttl_seconds: Time-to-live for task metadata
+        
+        Returns:
+            Task ID for tracking
+        """
+        task_id = uuid.uuid4().hex
+        
+        if not self.client:
+            logger.debug(f"Redis unavailable, storing task in memory: {task_id}")
+            return task_id
+        
+        try:
+            task_key = self._get_task_key(task_id)
+            task_obj = _new_task_obj(task_id, task_type, task_data, queue_name, retry_count)
+            
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.hset(task_key, mapping=task_obj)
+                pipe.expire(task_key, ttl_seconds)
+                pipe.rpush(self._get_queue_key(queue_name), task_id)
+                pipe.sadd(self._queues_key, queue_name)
+                await pipe.execute()
+            
+            logger.info(f"Enqueued task {task_id}: {task_type}")
+            return task_id
+        
+        except Exception as e:
+            logger.error(f"Error enqueuing task: {e}")
+            raise
+
 
 # Global queue instance
 _queue_instance: Optional[RedisQueue] = None
+_async_queue_instance: Optional[AsyncRedisQueue] = None
 
 
 def get_queue(redis_config: Optional[Dict[str, Any]] = None) -> RedisQueue:
@@ -359,12 +691,33 @@ def get_queue(redis_config: Optional[Dict[str, Any]] = None) -> RedisQueue:
             queue_prefix=redis_config.get("queue_prefix", "ao:tasks"),
             use_fake_redis=redis_config.get("use_fake_redis", False),
             allow_fallback=redis_config.get("allow_fallback", True),
-            required=redis_config.get("required", False)
+            required=redis_config.get("required", False),
+            max_connections=redis_config.get("max_connections", 64),
+            pool_timeout=redis_config.get("pool_timeout", 20)
         )
     
     return _queue_instance
 
 
+def get_async_queue(redis_config: Optional[Dict[str, Any]] = None) -> AsyncRedisQueue:
+    """Get or create global async Redis queue, mirroring the global sync queue"""
+    global _async_queue_instance
+    
+    if _async_queue_instance is None:
+        _async_queue_instance = AsyncRedisQueue(get_queue(redis_config))
+    
+    return _async_queue_instance
+
+
+async def close_async_queue() -> None:
+    """Close the global async queue if one was created"""
+    global _async_queue_instance
+    
+    if _async_queue_instance is not None:
+        await _async_queue_instance.close()
+        _async_queue_instance = None
+
+
 # Task handlers
 def register_task_handler(task_type: str, handler: Callable) -> None:
     """
@@ -384,7 +737,7 @@ def register_task_handler(task_type: str, handler: Callable) -> None:
 # Middleware for FastAPI
 async def enqueue_background_task(task_type: str,
                                    task_data: Dict[str, Any],
-                                   queue: RedisQueue = None,
+                                   queue: Union[RedisQueue, AsyncRedisQueue, None] = None,
                                    queue_name: str = "default") -> str:
     """
     Enqueue a background task instead of using BackgroundTasks
@@ -402,11 +755,24 @@ async def enqueue_background_task(task_type: str,
             )
             
             return response
+    
+    queue may be an AsyncRedisQueue or a RedisQueue. The global sync queue
+    is served by the global async queue; any other RedisQueue enqueues on
+    a worker thread so the event loop is not blocked.
     """
-    if queue is None:
-        queue = get_queue()
+    if queue is None or queue is _queue_instance:
+        queue = get_async_queue()
+    
+    if isinstance(queue, RedisQueue):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(
+            queue.enqueue,
+            task_type=task_type,
+            task_data=task_data,
+            queue_name=queue_name
+        ))
     
-    task_id = queue.enqueue(
+    task_id = await queue.enqueue(
         task_type=task_type,
         task_data=task_data,
         queue_name=queue_name
@@ -3,6 +3,7 @@ Security utilities for Automation Orchestrator
 Provides validators, sanitizers, and security functions
 """
 
+import os
 import re
 import secrets
 import ipaddress
@@ -13,12 +14,50 @@ from typing import Optional, Set, Dict, Any
 from urllib.parse import urlparse
 from email.utils import parseaddr
 import hashlib
+import hmac
 import logging
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
 import json
 
+# Optional C prefix trie for blocked-network lookups
+try:
+    import pytricia
+    HAS_PYTRICIA = True
+except ImportError:
+    HAS_PYTRICIA = False
+
 logger = logging.getLogger(__name__)
 
+# Seconds a webhook hostname resolution is reused before resolving again
+DNS_CACHE_TTL = 15
+
+
+@lru_cache(maxsize=4096)
+def _resolve_host(hostname: str, ttl_bucket: int) -> str:
+    """Resolve a hostname; ttl_bucket expires entries every DNS_CACHE_TTL seconds"""
+    return socket.gethostbyname(hostname)
+
+
+# PERFORMANCE: Repeated webhook URLs reuse their parse result
+_parse_url = lru_cache(maxsize=2048)(urlparse)
+
+# Seconds a resolved file path is reused; bounds how long a symlink change goes unseen
+PATH_CACHE_TTL = 5
+
+
+@lru_cache(maxsize=2048)
+def _resolve_path(file_path: str, cwd: str, ttl_bucket: int) -> Path:
+    """Resolve a path; cwd and ttl_bucket in the key keep cached results from going stale"""
+    return Path(file_path).resolve()
+
+
+def _dir_prefix(directory: Path) -> str:
+    """Directory as a separator-terminated string for prefix containment checks"""
+    prefix = os.path.normcase(str(directory))
+    return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
 # ============================================================================
 # Input Validation Classes
 # ============================================================================
@@ -151,32 +190,34 @@ class PathValidator:
         Path("data").resolve(),
         Path("backups").resolve(),
     ]
+    # Kept in sync by add_allowed_directory
+    _ALLOWED_PREFIXES = tuple(_dir_prefix(d) for d in ALLOWED_BASE_DIRS)
     
     @classmethod
     def validate_path(cls, file_path: str, base_dir: Optional[Path] = None) -> Path:
         """Validate path is within allowed directories"""
         try:
-            path = Path(file_path).resolve()
+            # PERFORMANCE: Reuse recent resolutions instead of re-walking every component
+            path = _resolve_path(file_path, os.getcwd(), int(time.time() // PATH_CACHE_TTL))
         except Exception as e:
             raise ValueError(f"Invalid path format: {e}")
         
         # Create allowed dirs list
-        check_dirs = cls.ALLOWED_BASE_DIRS if base_dir is None else [base_dir.resolve()]
+        prefixes = cls._ALLOWED_PREFIXES if base_dir is None else (_dir_prefix(base_dir.resolve()),)
         
-        # Check if path is within allowed directories
-        for allowed in check_dirs:
-            try:
-                path.relative_to(allowed)
-                return path
-            except ValueError:
-                continue
+        # Check if path is within allowed directories; the trailing separator
+        # also admits the directory itself, as relative_to did
+        if (os.path.normcase(str(path)) + os.sep).startswith(prefixes):
+            return path
         
         raise ValueError(f"Path is outside allowed directories")
     
     @classmethod
     def add_allowed_directory(cls, dir_path: str) -> None:
         """Add directory to allowed list"""
-        cls.ALLOWED_BASE_DIRS.append(Path(dir_path).resolve())
+        directory = Path(dir_path).resolve()
+        cls.ALLOWED_BASE_DIRS.append(directory)
+        cls._ALLOWED_PREFIXES += (_dir_prefix(directory),)
 
 
 class WebhookValidator:
@@ -196,6 +237,9 @@ class WebhookValidator:
     ALLOWED_SCHEMES = ["https"]  # Only HTTPS
     MAX_URL_LENGTH = 2048
     
+    # Suspicious URL fragments, compiled once into a single-pass alternation
+    SUSPICIOUS_REGEX = re.compile(r'@|localhost|127\.0\.0\.1|169\.254|metadata', re.IGNORECASE)
+    
     @classmethod
     def validate_webhook_url(cls, url: str) -> str:
         """Validate webhook URL is safe - prevents SSRF"""
@@ -204,7 +248,7 @@ class WebhookValidator:
         
         # Parse URL
         try:
-            parsed = urlparse(url)
+            parsed = _parse_url(url)
         except Exception:
             raise ValueError("Invalid webhook URL format")
         
@@ -218,24 +262,54 @@ class WebhookValidator:
         
         # Resolve hostname to IP and check against blocked networks
         try:
-            ip = socket.gethostbyname(parsed.hostname)
-            ip_addr = ipaddress.ip_address(ip)
+            # PERFORMANCE: Skip the blocking DNS round-trip for recently seen hosts
+            ip = _resolve_host(parsed.hostname, int(time.time() // DNS_CACHE_TTL))
             
-            for network in cls.BLOCKED_NETWORKS:
-                if ip_addr in network:
-                    raise ValueError(f"Webhook URL resolves to blocked network")
+            if cls._is_blocked_ip(ip):
+                raise ValueError(f"Webhook URL resolves to blocked network")
         except socket.gaierror:
             raise ValueError("Cannot resolve webhook hostname")
         except Exception as e:
             raise ValueError(f"Webhook validation failed: {e}")
         
         # Check for suspicious patterns
-        suspicious_patterns = [r'@', r'localhost', r'127\.0\.0\.1', r'169\.254', r'metadata']
-        for pattern in suspicious_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                raise ValueError("Webhook URL contains suspicious patterns")
+        if cls.SUSPICIOUS_REGEX.search(url):
+            raise ValueError("Webhook URL contains suspicious patterns")
         
         return url
+    
+    @classmethod
+    def _is_blocked_ip(cls, ip: str) -> bool:
+        """Check an IP string against BLOCKED_NETWORKS"""
+        if HAS_PYTRICIA:
+            # PERFORMANCE: Longest-prefix walk in C instead of one Python
+            # containment test per blocked network
+            trie = _BLOCKED_TRIES[6 if ':' in ip else 4]
+            return ip in trie
+        
+        # PERFORMANCE: Parse with inet_pton and compare against precomputed
+        # integer (network, netmask) pairs instead of ipaddress containment
+        if ':' in ip:
+            version, packed = 6, socket.inet_pton(socket.AF_INET6, ip)
+        else:
+            version, packed = 4, socket.inet_pton(socket.AF_INET, ip)
+        ip_int = int.from_bytes(packed, 'big')
+        return any(ip_int & mask == net for net, mask in _BLOCKED_MASKS[version])
+
+
+# Blocked networks pre-indexed by IP version, built once at import
+_BLOCKED_MASKS: Dict[int, tuple] = {
+    version: tuple(
+        (int(n.network_address), int(n.netmask))
+        for n in WebhookValidator.BLOCKED_NETWORKS if n.version == version
+    )
+    for version in (4, 6)
+}
+
+if HAS_PYTRICIA:
+    _BLOCKED_TRIES = {4: pytricia.PyTricia(32), 6: pytricia.PyTricia(128)}
+    for _network in WebhookValidator.BLOCKED_NETWORKS:
+        _BLOCKED_TRIES[_network.version].insert(str(_network), True)
 
 
 # ============================================================================
@@ -337,6 +411,9 @@ class SecurityKeyManager:
         self.key_file = Path(key_file)
         self.key_file.parent.mkdir(parents=True, exist_ok=True)
         self._key = self._load_or_create_key()
+        # PERFORMANCE: Keyed once; sign() copies this instead of re-deriving
+        # the HMAC inner/outer pads on every call
+        self._hmac_template = hmac.new(self._key.encode(), digestmod=hashlib.sha256)
     
     def _load_or_create_key(self) -> str:
         """Load existing key or create new one"""
@@ -360,13 +437,9 @@ class SecurityKeyManager:
     
     def sign(self, data: str) -> str:
         """Sign data using HMAC"""
-        import hmac
-        signature = hmac.new(
-            self._key.encode(),
-            data.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        mac = self._hmac_template.copy()
+        mac.update(data.encode())
+        return mac.hexdigest()
     
     def verify(self, data: str, signature: str) -> bool:
         """Verify data signature"""
@@ -414,44 +487,60 @@ class OutputSanitizer:
 class RateLimiter:
     """Simple rate limiting mechanism"""
     
-    def __init__(self, max_requests: int = 100, window_seconds: int = 60):
+    def __init__(self, max_requests: int = 100, window_seconds: int = 60,
+                 max_identifiers: int = 10000):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, list] = {}
+        # Idle identifiers beyond this count are evicted, oldest first
+        self.max_identifiers = max_identifiers
+        # PERFORMANCE: Per-identifier deque of monotonic timestamps, pruned
+        # from the left in place; ordered by last use for idle eviction
+        self.requests: "OrderedDict[str, deque]" = OrderedDict()
+    
+    def _prune(self, bucket: deque, now: float) -> None:
+        """Drop timestamps that have left the window"""
+        cutoff = now - self.window_seconds
+        while bucket and bucket[0] <= cutoff:
+            bucket.popleft()
+    
+    def _evict_idle(self, now: float) -> None:
+        """Drop least recently used identifiers with no requests in the window"""
+        cutoff = now - self.window_seconds
+        while len(self.requests) > self.max_identifiers:
+            oldest = next(iter(self.requests.values()))
+            if oldest and oldest[-1] > cutoff:
+                break
+            self.requests.popitem(last=False)
     
     def is_allowed(self, identifier: str) -> bool:
         """Check if request is allowed"""
-        now = datetime.now().timestamp()
-        
-        if identifier not in self.requests:
-            self.requests[identifier] = []
+        now = time.monotonic()
         
-        # Remove old requests outside window
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier]
-            if now - req_time < self.window_seconds
-        ]
+        bucket = self.requests.get(identifier)
+        if bucket is None:
+            bucket = self.requests[identifier] = deque(maxlen=self.max_requests)
+            self._evict_idle(now)
+        else:
+            self.requests.move_to_end(identifier)
+            # Remove old requests outside window
+            self._prune(bucket, now)
         
         # Check limit
-        if len(self.requests[identifier]) >= self.max_requests:
+        if len(bucket) >= self.max_requests:
             return False
         
         # Add new request
-        self.requests[identifier].append(now)
+        bucket.append(now)
         return True
     
     def get_remaining(self, identifier: str) -> int:
         """Get remaining requests in current window"""
-        if identifier not in self.requests:
+        bucket = self.requests.get(identifier)
+        if bucket is None:
             return self.max_requests
         
-        now = datetime.now().timestamp()
-        valid_requests = [
-            req_time for req_time in self.requests[identifier]
-            if now - req_time < self.window_seconds
-        ]
-        
-        return max(0, self.max_requests - len(valid_requests))
+        self._prune(bucket, time.monotonic())
+        return max(0, self.max_requests - len(bucket))
 
 
 # ============================================================================
@@ -218,26 +218,10 @@ class WorkflowRunner:
         Returns:
             List of lead dictionaries
         """
-        leads = []
         sources = workflow.get('sources', [])
         
-        for source in sources:
-            source_type = source.get('type')
-            
-            if source_type == 'web_form':
-                # Fetch leads from web form endpoint
-                form_leads = self.lead_ingest.fetch_web_form(source)
-                leads.extend(form_leads)
-                
-            elif source_type == 'email':
-                # Fetch leads from email
-                email_leads = self.lead_ingest.fetch_email(source)
-                leads.extend(email_leads)
-                
-            else:
-                self.logger.warning(f"Unknown source type: {source_type}")
-        
-        return leads
+        # Web form and email sources are fetched concurrently
+        return self.lead_ingest.fetch_all(sources)
     
     def _process_lead(self, lead: Dict[str, Any], workflow: Dict[str, Any]):
         """
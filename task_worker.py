@@ -224,9 +224,16 @@ class TaskWorker:
         """
         self.running = True
         logger.info(f"[{self.worker_id}] Worker started, polling queue '{self.queue_name}'")
+        next_retry_check = 0.0
         
         try:
             while self.running:
+                # Re-queue failed tasks whose retry backoff has elapsed (at most once a second)
+                now = time.time()
+                if now >= next_retry_check:
+                    self.queue.promote_due_retries(self.queue_name, now=now)
+                    next_retry_check = now + 1.0
+                
                 # Attempt to get task from queue (non-blocking)
                 task = self.queue.dequeue(queue_name=self.queue_name, timeout=0)
                 
@@ -0,0 +1,155 @@
+"""
+Deduplication Engine Test Suite for Automation Orchestrator
+Tests fuzzy scoring, candidate blocking and duplicate grouping
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator.deduplication import DeduplicationEngine
+
+
+def _lead(first_name, last_name="", **fields):
+    """Build a lead dict with the given name"""
+    return {"first_name": first_name, "last_name": last_name, **fields}
+
+
+@pytest.fixture
+def fuzzy_engine():
+    """Engine matching on names only"""
+    return DeduplicationEngine({
+        "enabled": True,
+        "strategies": ["fuzzy"],
+        "fuzzy_threshold": 0.85
+    })
+
+
+class TestFuzzyScorer:
+    """Test the whole-string fuzzy similarity"""
+
+    def test_subset_name_is_not_a_match(self):
+        """A name whose tokens are a subset of another's is not a full match"""
+        assert DeduplicationEngine._string_similarity("john", "john smith", 0.85) < 0.85
+        assert DeduplicationEngine._string_similarity("mary lee", "mary ann lee", 0.85) < 0.85
+
+    def test_typo_is_a_match(self):
+        """A single-character typo stays above the default threshold"""
+        assert DeduplicationEngine._string_similarity("jon smith", "john smith", 0.85) >= 0.85
+
+    def test_subset_names_do_not_group(self, fuzzy_engine):
+        """A bare first name must not pull unrelated full names together"""
+        leads = [
+            _lead("John"),
+            _lead("John", "Smith"),
+            _lead("John", "Doe"),
+            _lead("Mary Ann", "Lee"),
+            _lead("Mary", "Lee"),
+            _lead("John", "Smith"),
+        ]
+        assert fuzzy_engine.find_duplicates(leads) == [[1, 5]]
+
+
+def _pairwise_duplicates(leads, strategies, threshold):
+    """Reference copy of the original all-pairs scan"""
+    import re
+    from difflib import SequenceMatcher
+
+    def phone(lead):
+        return re.sub(r'\D', '', lead.get("phone") or "")
+
+    def name(lead):
+        return f"{lead.get('first_name', '')} {lead.get('last_name', '')}".lower().strip()
+
+    def are_duplicates(lead1, lead2):
+        for strategy in strategies:
+            if strategy == "email":
+                email1 = (lead1.get("email") or "").lower().strip()
+                if email1 and email1 == (lead2.get("email") or "").lower().strip():
+                    return True
+            elif strategy == "phone":
+                phone1 = phone(lead1)
+                if phone1 and len(phone1) >= 7 and phone1 == phone(lead2):
+                    return True
+            elif strategy == "fuzzy":
+                name1 = name(lead1)
+                if len(name1) >= 3 and SequenceMatcher(None, name1, name(lead2)).ratio() >= threshold:
+                    return True
+        return False
+
+    duplicates = []
+    checked = set()
+    for i, lead1 in enumerate(leads):
+        if i in checked:
+            continue
+        group = [i]
+        for j in range(i + 1, len(leads)):
+            if j not in checked and are_duplicates(lead1, leads[j]):
+                group.append(j)
+                checked.add(j)
+        if len(group) > 1:
+            duplicates.append(group)
+            checked.add(i)
+    return duplicates
+
+
+FIXTURE_LEADS = [
+    _lead("John", "Smith", email="john@acme.com", phone="555-010-2000"),
+    _lead("Jon", "Smith", email="jsmith@other.com"),
+    _lead("Jhon", "Smtih"),
+    _lead("John"),
+    _lead("John", "Doe", phone="(555) 010-2000"),
+    _lead("Mary Ann", "Lee", email="MARY@acme.com "),
+    _lead("Mary", "Lee", email="mary@acme.com"),
+    _lead("Catherine", "Thompson"),
+    _lead("Katherine", "Thompson"),
+    _lead("Kathryn", "Thomson"),
+    _lead("Steven", "Jonson", phone="12"),
+    _lead("Stephen", "Johnson", phone="12"),
+    _lead("Robert", "McDonald"),
+    _lead("Rupert", "MacDonald"),
+    _lead("Al", ""),
+    _lead("Al", ""),
+    _lead("Jonathan", "Smith", email="john@acme.com"),
+    _lead("Jonathon", "Smith"),
+]
+
+
+class TestFindDuplicates:
+    """Test blocked grouping against the original pairwise scan"""
+
+    @pytest.mark.parametrize("strategies", [
+        ["email"],
+        ["phone"],
+        ["fuzzy"],
+        ["email", "phone"],
+        ["email", "phone", "fuzzy"],
+    ])
+    @pytest.mark.parametrize("threshold", [0.8, 0.85, 0.9])
+    def test_matches_pairwise_scan(self, strategies, threshold):
+        """Blocking must not change which groups are found"""
+        engine = DeduplicationEngine({
+            "enabled": True,
+            "strategies": strategies,
+            "fuzzy_threshold": threshold
+        })
+        assert engine.find_duplicates(FIXTURE_LEADS) == \
+            _pairwise_duplicates(FIXTURE_LEADS, strategies, threshold)
+
+    def test_typo_in_first_name_prefix_is_found(self, fuzzy_engine):
+        """Leads whose first names differ in the first three letters still meet"""
+        leads = [_lead("Jon", "Smith"), _lead("John", "Smith"), _lead("Jhon", "Smith")]
+        assert fuzzy_engine.find_duplicates(leads) == [[0, 1, 2]]
+
+    def test_matches_are_not_chained(self):
+        """A lead only joins a group by matching its first member directly"""
+        engine = DeduplicationEngine({"enabled": True, "strategies": ["email", "phone"]})
+        leads = [
+            {"email": "a@acme.com", "phone": ""},
+            {"email": "a@acme.com", "phone": "5550102000"},
+            {"email": "b@acme.com", "phone": "5550102000"},
+        ]
+        assert engine.find_duplicates(leads) == [[0, 1]]
@@ -0,0 +1,145 @@
+"""
+Lead Ingest Test Suite for Automation Orchestrator
+Tests email field extraction, processed-ID tracking and IMAP batching
+"""
+
+import logging
+import pytest
+from unittest.mock import MagicMock, patch
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator import lead_ingest
+from automation_orchestrator.lead_ingest import LeadIngest, ProcessedIdFilter
+
+
+@pytest.fixture
+def ingest():
+    """Lead ingest with an empty configuration"""
+    return LeadIngest({})
+
+
+class TestExtractFields:
+    """Test structured field extraction from email bodies"""
+
+    def test_overlapping_fields_are_all_found(self, ingest):
+        """A field inside another field's match is still extracted"""
+        source_config = {"extraction_patterns": {
+            "name": r"Name:\s*(.+)",
+            "email": r"([\w.+-]+@[\w-]+\.[\w.]+)",
+            "company": r"Company:\s*(.+)",
+        }}
+        body = "Name: Bob john@acme.com\nCompany: X"
+
+        assert ingest._extract_fields_from_body(body, source_config) == {
+            "name": "Bob john@acme.com",
+            "email": "john@acme.com",
+            "company": "X",
+        }
+
+    def test_first_match_per_field_wins(self, ingest):
+        """Each field takes its first match in the body"""
+        source_config = {"extraction_patterns": {"phone": r"Phone:\s*(\S+)"}}
+        body = "Phone: 111\nPhone: 222"
+
+        assert ingest._extract_fields_from_body(body, source_config) == {"phone": "111"}
+
+    def test_no_patterns(self, ingest):
+        """Without patterns nothing is extracted"""
+        assert ingest._extract_fields_from_body("Name: Bob", {}) == {}
+
+
+class TestProcessedIds:
+    """Test processed lead ID tracking"""
+
+    def test_duplicate_is_skipped(self, ingest):
+        """A recently processed ID is reported as already processed"""
+        assert ingest._mark_processed("lead_1") is True
+        assert ingest._mark_processed("lead_1") is False
+        assert ingest._mark_processed("lead_2") is True
+
+    def test_old_ids_are_still_skipped(self, ingest):
+        """An ID processed many leads ago is still recognized"""
+        ingest._mark_processed("lead_old")
+        for i in range(200_000):
+            ingest.processed_ids.add(f"lead_{i}")
+
+        assert ingest._mark_processed("lead_old") is False
+
+    def test_skips_are_logged(self, ingest, caplog):
+        """Every skip is logged, including Bloom false positives"""
+        # Saturate a tiny filter so every lookup is a Bloom hit
+        ingest.processed_ids = ProcessedIdFilter(capacity=1, error_rate=0.5)
+        for i in range(64):
+            ingest.processed_ids.add(f"old_{i}")
+
+        with caplog.at_level(logging.INFO, logger="automation_orchestrator.lead_ingest"):
+            assert ingest._mark_processed("never_seen") is False
+        assert "never_seen" in caplog.text
+
+    def test_filter_counts_added_ids(self):
+        """Membership holds for added IDs and len counts additions"""
+        processed = ProcessedIdFilter(capacity=100)
+        for lead_id in ("a", "b", "c"):
+            processed.add(lead_id)
+
+        assert all(lead_id in processed for lead_id in ("a", "b", "c"))
+        assert len(processed) == 3
+
+
+def _raw_email(sender):
+    """Minimal RFC 822 message from the given sender"""
+    return f"From: {sender}\r\nSubject: Hi\r\nDate: Mon, 1 Jan 2024 00:00:00 +0000\r\n\r\nHello".encode()
+
+
+class TestFetchEmail:
+    """Test batched IMAP fetching"""
+
+    SOURCE = {"type": "email", "server": "imap.example.com", "username": "u", "password": "p"}
+
+    def _mailbox(self, failing_batch):
+        """Mock IMAP connection holding messages 1-5; one batch fetch raises"""
+        mail = MagicMock()
+        mail.search.return_value = ("OK", [b"1 2 3 4 5"])
+
+        def fetch(batch_ids, query):
+            if batch_ids == failing_batch:
+                raise OSError("connection reset")
+            return "OK", [
+                (msg_id + b" (BODY[] {10}", _raw_email(f"user{int(msg_id)}@acme.com"))
+                for msg_id in batch_ids.split(b",")
+            ]
+
+        mail.fetch.side_effect = fetch
+        return mail
+
+    def test_failed_batch_does_not_abort_later_batches(self, ingest, monkeypatch):
+        """A batch that fails to fetch is skipped and later batches still run"""
+        monkeypatch.setattr(lead_ingest, "IMAP_FETCH_BATCH_SIZE", 2)
+        mail = self._mailbox(failing_batch=b"3,4")
+
+        with patch("imaplib.IMAP4_SSL", return_value=mail):
+            leads = ingest.fetch_email(self.SOURCE)
+
+        assert [lead["email"] for lead in leads] == ["user1@acme.com", "user2@acme.com", "user5@acme.com"]
+        stored = [c.args[0] for c in mail.store.call_args_list]
+        assert stored == [b"1,2", b"5"]
+
+    def test_only_parsed_messages_are_marked_seen(self, ingest, monkeypatch):
+        """Messages that fail to parse stay unread for the next poll"""
+        monkeypatch.setattr(lead_ingest, "IMAP_FETCH_BATCH_SIZE", 10)
+        mail = self._mailbox(failing_batch=None)
+        parse = ingest._parse_email_to_lead
+
+        def parse_or_fail(message, *args):
+            return None if "user2@" in message["From"] else parse(message, *args)
+
+        monkeypatch.setattr(ingest, "_parse_email_to_lead", parse_or_fail)
+        with patch("imaplib.IMAP4_SSL", return_value=mail):
+            leads = ingest.fetch_email(self.SOURCE)
+
+        assert len(leads) == 4
+        mail.store.assert_called_once_with(b"1,3,4,5", "+FLAGS", "\\Seen")
@@ -0,0 +1,83 @@
+"""
+Multi-Tenancy Test Suite for Automation Orchestrator
+Tests tenant settings and tenant membership
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator.multi_tenancy import TenantManager
+
+
+@pytest.fixture
+def manager():
+    """Empty tenant manager"""
+    return TenantManager()
+
+
+class TestTenantSettings:
+    """Test tenant settings storage"""
+
+    def test_settings_writes_persist(self, manager):
+        """Changes made through tenant.settings are kept"""
+        tenant = manager.create_tenant("Acme", "owner", plan="pro")
+        tenant.settings["crm_type"] = "hubspot"
+        tenant.settings["branding"]["primary_color"] = "#ff0000"
+
+        settings = tenant.to_dict()["settings"]
+        assert settings["crm_type"] == "hubspot"
+        assert settings["branding"]["primary_color"] == "#ff0000"
+
+    def test_plan_change_updates_features(self, manager):
+        """Changing plan swaps the feature set"""
+        tenant = manager.create_tenant("Acme", "owner", plan="free")
+        assert not tenant.has_feature("analytics")
+
+        manager.update_tenant_plan(tenant.tenant_id, "pro")
+        assert tenant.has_feature("analytics")
+        assert tenant.to_dict()["settings"]["features"]["hubspot_sync"] is True
+
+    def test_feature_and_rate_limit_overrides_are_per_tenant(self, manager):
+        """Overriding one tenant's features or limits leaves other tenants alone"""
+        first = manager.create_tenant("First", "owner1", plan="starter")
+        second = manager.create_tenant("Second", "owner2", plan="starter")
+
+        first.settings["features"]["sso"] = True
+        first.rate_limit["requests_per_second"] = 5
+
+        assert first.has_feature("sso")
+        assert not second.has_feature("sso")
+        assert second.rate_limit["requests_per_second"] == 50
+        assert manager.create_tenant("Third", "owner3").rate_limit["requests_per_second"] == 50
+
+
+class TestTenantMembership:
+    """Test tenant user membership"""
+
+    def test_owner_is_listed_first(self, manager):
+        """Tenant users keep the owner first, then join order"""
+        tenant = manager.create_tenant("Acme", "owner")
+        for user_id in ("zoe", "adam", "mia", "bob"):
+            manager.add_user_to_tenant(tenant.tenant_id, user_id)
+        manager.add_user_to_tenant(tenant.tenant_id, "adam")
+        manager.remove_user_from_tenant(tenant.tenant_id, "mia")
+
+        assert manager.get_tenant_users(tenant.tenant_id) == ["owner", "zoe", "adam", "bob"]
+        assert manager.is_tenant_user(tenant.tenant_id, "bob")
+        assert not manager.is_tenant_user(tenant.tenant_id, "mia")
+
+    def test_user_tenants_in_creation_order(self, manager):
+        """A user's tenants are listed in tenant creation order"""
+        first = manager.create_tenant("First", "owner1")
+        second = manager.create_tenant("Second", "owner2")
+        manager.add_user_to_tenant(second.tenant_id, "user")
+        manager.add_user_to_tenant(first.tenant_id, "user")
+
+        assert manager.get_user_tenants("user") == [first.tenant_id, second.tenant_id]
+        manager.remove_user_from_tenant(first.tenant_id, "user")
+        assert manager.get_user_tenants("user") == [second.tenant_id]
+
@@ -0,0 +1,81 @@
+"""
+Rate Limiter Test Suite for Automation Orchestrator
+Tests sliding-window limits and idle identifier eviction
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator import security
+from automation_orchestrator.security import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock; set clock.now to move time"""
+    class Clock:
+        now = 1000.0
+
+    monkeypatch.setattr(security.time, "monotonic", lambda: Clock.now)
+    return Clock
+
+
+class TestRateLimiter:
+    """Test RateLimiter windows"""
+
+    def test_limit_within_window(self, clock):
+        """Requests beyond the limit are refused until the window slides"""
+        limiter = RateLimiter(max_requests=3, window_seconds=10)
+
+        assert [limiter.is_allowed("ip") for _ in range(4)] == [True, True, True, False]
+        assert limiter.get_remaining("ip") == 0
+        assert limiter.is_allowed("other")
+
+        clock.now += 10
+        assert limiter.get_remaining("ip") == 3
+        assert limiter.is_allowed("ip")
+
+    def test_window_slides_per_request(self, clock):
+        """Each timestamp expires on its own, not the whole window at once"""
+        limiter = RateLimiter(max_requests=2, window_seconds=10)
+        limiter.is_allowed("ip")
+        clock.now += 5
+        limiter.is_allowed("ip")
+
+        clock.now += 5
+        assert limiter.get_remaining("ip") == 1
+        assert limiter.is_allowed("ip")
+        assert not limiter.is_allowed("ip")
+
+    def test_refused_requests_are_not_counted(self, clock):
+        """Refused requests do not extend the window"""
+        limiter = RateLimiter(max_requests=1, window_seconds=10)
+        limiter.is_allowed("ip")
+        clock.now += 9
+        assert not limiter.is_allowed("ip")
+
+        clock.now += 1
+        assert limiter.is_allowed("ip")
+
+    def test_idle_identifiers_are_evicted(self, clock):
+        """Past max_identifiers, idle identifiers are dropped oldest first"""
+        limiter = RateLimiter(max_requests=5, window_seconds=10, max_identifiers=2)
+        limiter.is_allowed("a")
+        limiter.is_allowed("b")
+        clock.now += 10
+        limiter.is_allowed("c")
+
+        assert list(limiter.requests) == ["b", "c"]
+
+    def test_active_identifiers_are_kept(self, clock):
+        """Identifiers with requests in the window are never evicted"""
+        limiter = RateLimiter(max_requests=1, window_seconds=10, max_identifiers=1)
+        limiter.is_allowed("a")
+        limiter.is_allowed("b")
+
+        assert list(limiter.requests) == ["a", "b"]
+        assert not limiter.is_allowed("a")
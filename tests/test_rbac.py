@@ -0,0 +1,102 @@
+"""
+RBAC Test Suite for Automation Orchestrator
+Tests permission checks, the role index and the vectorized mask table
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator.rbac import RBACManager, Role, Permission
+
+
+@pytest.fixture(params=["mask_table", "scan"])
+def rbac(request):
+    """Manager with four users, with and without the numpy mask table"""
+    manager = RBACManager()
+    if request.param == "scan":
+        manager._mask_table = None
+    elif manager._mask_table is None:
+        pytest.skip("numpy not installed")
+
+    manager.create_user("u1", "alice", Role.ADMIN)
+    manager.create_user("u2", "bob", Role.SALESPERSON)
+    manager.create_user("u3", "carol", Role.ANALYST)
+    manager.create_user("u4", "dave", Role.SALESPERSON)
+    return manager
+
+
+def _ids(users):
+    return [user.user_id for user in users]
+
+
+class TestPermissionQueries:
+    """Test cohort permission queries"""
+
+    def test_users_with_permission(self, rbac):
+        """Admins hold every permission; results keep creation order"""
+        assert _ids(rbac.get_users_with_permission(Permission.LEAD_CREATE)) == ["u1", "u2", "u4"]
+        assert _ids(rbac.get_users_with_permission(Permission.SYSTEM_ADMIN)) == ["u1"]
+
+    def test_batch_authorize(self, rbac):
+        """One result per ID, in order; unknown IDs are denied"""
+        assert rbac.batch_authorize(["u3", "u2", "nobody", "u1"], Permission.LEAD_CREATE) == \
+            [False, True, False, True]
+        assert rbac.batch_authorize([], Permission.LEAD_READ) == []
+
+    def test_manager_methods_update_queries(self, rbac):
+        """Grants, revokes and deactivation are reflected immediately"""
+        rbac.grant_custom_permission("u3", Permission.LEAD_CREATE)
+        rbac.deactivate_user("u2")
+        assert _ids(rbac.get_users_with_permission(Permission.LEAD_CREATE)) == ["u1", "u3", "u4"]
+        assert rbac.batch_authorize(["u2", "u3"], Permission.LEAD_CREATE) == [False, True]
+
+        rbac.revoke_custom_permission("u3", Permission.LEAD_CREATE)
+        rbac.activate_user("u2")
+        assert _ids(rbac.get_users_with_permission(Permission.LEAD_CREATE)) == ["u1", "u2", "u4"]
+
+    def test_direct_attribute_changes_update_queries(self, rbac):
+        """Changing a user's attributes directly keeps the indexes current"""
+        carol = rbac.get_user("u3")
+        carol.role = Role.MANAGER
+        rbac.get_user("u4").active = False
+        rbac.get_user("u1").custom_permissions.add(Permission.CRM_SYNC)
+        rbac.get_user("u2").custom_permissions.add(Permission.CRM_SYNC)
+        rbac.get_user("u2").invalidate_permissions()
+
+        assert _ids(rbac.get_users_with_permission(Permission.LEAD_CREATE)) == ["u1", "u2", "u3"]
+        assert _ids(rbac.get_users_with_permission(Permission.CRM_SYNC)) == ["u1", "u2", "u3"]
+        assert rbac.batch_authorize(["u3", "u4"], Permission.USER_READ) == [True, False]
+        assert _ids(rbac.get_users_with_role(Role.MANAGER)) == ["u3"]
+        assert _ids(rbac.get_users_with_role(Role.ANALYST)) == []
+
+
+class TestRoleIndex:
+    """Test role lookups"""
+
+    def test_role_change_keeps_creation_order(self, rbac):
+        """A user moved into a role is listed in creation order"""
+        rbac.update_user_role("u1", Role.SALESPERSON)
+        assert _ids(rbac.get_users_with_role(Role.SALESPERSON)) == ["u1", "u2", "u4"]
+
+        rbac.get_user("u3").role = Role.SALESPERSON
+        rbac.create_user("u5", "erin", Role.SALESPERSON)
+        assert _ids(rbac.get_users_with_role(Role.SALESPERSON)) == ["u1", "u2", "u3", "u4", "u5"]
+        assert _ids(rbac.get_users_with_role(Role.ADMIN)) == []
+
+
+class TestUserSerialization:
+    """Test User.to_dict"""
+
+    def test_permissions_are_a_sorted_list(self, rbac):
+        """Serialized permissions are a fresh sorted list per call"""
+        bob = rbac.get_user("u2")
+        permissions = bob.to_dict()["permissions"]
+        assert isinstance(permissions, list)
+        assert permissions == sorted(p.value for p in bob.get_permissions())
+
+        permissions.append("mutated")
+        assert "mutated" not in bob.to_dict()["permissions"]
@@ -0,0 +1,177 @@
+"""
+Redis Queue Test Suite for Automation Orchestrator
+Tests task enqueueing, dequeueing and retry scheduling on fakeredis
+"""
+
+import asyncio
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from automation_orchestrator.redis_queue import (
+    RETRY_BASE_DELAY, AsyncRedisQueue, RedisQueue, enqueue_background_task
+)
+
+pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def queue():
+    """Sync queue on a private in-memory fakeredis server"""
+    redis_queue = RedisQueue(use_fake_redis=True)
+    yield redis_queue
+    redis_queue.close()
+
+
+@pytest.fixture(params=["lua", "pipelined"])
+def backend_queue(request, queue):
+    """Queue using the Lua scripts, or the pipelined fallback without them"""
+    if request.param == "lua":
+        pytest.importorskip("lupa")
+        assert queue._dequeue_sha and queue._fail_sha and queue._promote_sha
+    else:
+        queue._dequeue_sha = queue._fail_sha = queue._promote_sha = None
+    return queue
+
+
+def _retry_schedule(queue, queue_name="default"):
+    """Retry ZSET contents as {task_id: due_time}"""
+    return dict(queue.client.zrange(queue._get_retry_key(queue_name), 0, -1, withscores=True))
+
+
+class TestDequeue:
+    """Test claiming tasks from a queue"""
+
+    def test_fifo_and_claimed(self, backend_queue):
+        """Tasks come out in order, marked processing, with decoded payloads"""
+        first = backend_queue.enqueue("email_send", {"to": "a@acme.com", "n": 1})
+        second = backend_queue.enqueue("email_send", {"to": "b@acme.com"})
+
+        task = backend_queue.dequeue()
+        assert task["id"] == first
+        assert task["status"] == "processing"
+        assert task["data"] == {"to": "a@acme.com", "n": 1}
+        assert backend_queue.get_task_status(first)["status"] == "processing"
+
+        assert backend_queue.dequeue()["id"] == second
+        assert backend_queue.dequeue() is None
+
+    def test_missing_metadata_is_skipped(self, backend_queue):
+        """An ID without metadata is dropped without leaving a stray hash"""
+        backend_queue.client.rpush(backend_queue._get_queue_key("default"), "ghost")
+
+        assert backend_queue.dequeue() is None
+        assert not backend_queue.client.exists(backend_queue._get_task_key("ghost"))
+
+    def test_queue_stats(self, backend_queue):
+        """Stats list every non-empty registered queue"""
+        backend_queue.enqueue("a", {}, queue_name="crm")
+        backend_queue.enqueue("b", {}, queue_name="crm")
+        backend_queue.enqueue("c", {}, queue_name="email")
+        backend_queue.dequeue("email")
+
+        assert backend_queue.queue_stats() == {"crm": 2}
+
+
+class TestRetrySchedule:
+    """Test failure handling and delayed retries"""
+
+    def test_failure_schedules_backoff(self, backend_queue):
+        """A failed task waits on the retry ZSET with doubling delays"""
+        task_id = backend_queue.enqueue("crm_update", {}, queue_name="crm", retry_count=3)
+        backend_queue.dequeue("crm")
+
+        before = time.time()
+        assert backend_queue.mark_failed(task_id, "timeout")
+        status = backend_queue.get_task_status(task_id)
+        assert status["status"] == "retry"
+        assert status["error"] == "timeout"
+        assert status["retries_remaining"] == "2"
+        assert backend_queue.get_queue_depth("crm") == 0
+
+        due = _retry_schedule(backend_queue, "crm")[task_id]
+        assert before + RETRY_BASE_DELAY <= due <= time.time() + RETRY_BASE_DELAY
+
+        # Second failure doubles the delay
+        assert backend_queue.promote_due_retries("crm", now=due) == 1
+        backend_queue.dequeue("crm")
+        backend_queue.mark_failed(task_id, "timeout")
+        second_due = _retry_schedule(backend_queue, "crm")[task_id]
+        assert second_due - time.time() > RETRY_BASE_DELAY
+
+    def test_promote_only_due_tasks(self, backend_queue):
+        """Retries move back onto the queue once their delay has passed"""
+        task_id = backend_queue.enqueue("crm_update", {})
+        backend_queue.dequeue()
+        backend_queue.mark_failed(task_id, "boom")
+        due = _retry_schedule(backend_queue)[task_id]
+
+        assert backend_queue.promote_due_retries(now=due - 1) == 0
+        assert backend_queue.get_queue_depth() == 0
+
+        assert backend_queue.promote_due_retries(now=due) == 1
+        assert _retry_schedule(backend_queue) == {}
+        assert backend_queue.dequeue()["id"] == task_id
+        assert backend_queue.promote_due_retries(now=due) == 0
+
+    def test_promote_respects_limit(self, backend_queue):
+        """At most limit tasks are promoted per call, earliest first"""
+        task_ids = [backend_queue.enqueue("t", {}) for _ in range(3)]
+        for task_id in task_ids:
+            backend_queue.dequeue()
+            backend_queue.mark_failed(task_id, "boom")
+
+        far_future = time.time() + 3600
+        assert backend_queue.promote_due_retries(now=far_future, limit=2) == 2
+        assert backend_queue.promote_due_retries(now=far_future, limit=2) == 1
+        assert [backend_queue.dequeue()["id"] for _ in task_ids] == task_ids
+
+    def test_exhausted_or_disabled_retries_fail(self, backend_queue):
+        """No retry is scheduled once retries run out or retry=False"""
+        exhausted = backend_queue.enqueue("t", {}, retry_count=0)
+        no_retry = backend_queue.enqueue("t", {}, retry_count=3)
+        backend_queue.mark_failed(exhausted, "boom")
+        backend_queue.mark_failed(no_retry, "fatal", retry=False)
+
+        assert backend_queue.get_task_status(exhausted)["status"] == "failed"
+        assert backend_queue.get_task_status(no_retry)["status"] == "failed"
+        assert backend_queue.get_task_status(no_retry)["retries_remaining"] == "3"
+        assert _retry_schedule(backend_queue) == {}
+
+    def test_flushed_scripts_are_reloaded(self, backend_queue):
+        """Scripts lost from the server cache are run inline and re-registered"""
+        if backend_queue._dequeue_sha is None:
+            pytest.skip("Lua scripting not in use")
+        task_id = backend_queue.enqueue("t", {})
+        backend_queue.client.script_flush()
+
+        assert backend_queue.dequeue()["id"] == task_id
+        assert backend_queue.client.script_exists(backend_queue._dequeue_sha) == [True]
+
+
+class TestEnqueueBackgroundTask:
+    """Test the request-handler enqueue helper"""
+
+    @pytest.mark.parametrize("wrap", [False, True], ids=["sync_queue", "async_queue"])
+    def test_accepts_either_queue_type(self, queue, wrap):
+        """Tasks land on the same queue whichever queue type is passed"""
+        async def enqueue():
+            target = AsyncRedisQueue(queue) if wrap else queue
+            try:
+                return await enqueue_background_task(
+                    "crm_update", {"lead_id": "lead_1"}, queue=target, queue_name="crm"
+                )
+            finally:
+                if wrap:
+                    await target.close()
+
+        task_id = asyncio.run(enqueue())
+
+        task = queue.dequeue("crm")
+        assert task["id"] == task_id
+        assert task["type"] == "crm_update"
+        assert task["data"] == {"lead_id": "lead_1"}